@@ -4,6 +4,7 @@ import glob
 import os
 import sqlite3
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party modules
 from collections import OrderedDict
@@ -15,9 +16,9 @@ import holoviews as hv
 import panel as pn
 from bokeh.models import CheckboxGroup, TextInput
 from bokeh.models.widgets.tables import NumberFormatter, BooleanFormatter
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from openpyxl import Workbook
 from openpyxl.styles import Border, Side
+from openpyxl.utils import get_column_letter
 import PyQt5.QtWidgets as qtw
 import cequalw2 as w2
 import datetime
@@ -53,6 +54,13 @@ css = """
 
 pn.extension('tabulator', 'ipywidgets', raw_css=[css])
 
+# Background workers for Excel and SQLite exports, so that saving a large data set
+# does not block the Panel server while the file is written
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# Summary statistics run on their own worker, so that opening a file never waits behind queued exports
+_stats_executor = ThreadPoolExecutor(max_workers=1)
+
 
 def write_dataframe_to_excel(df, filename, index=True, sheet_name='Sheet1'):
     # Create an Excel writer using openpyxl
@@ -76,18 +84,16 @@ def write_dataframe_to_excel(df, filename, index=True, sheet_name='Sheet1'):
     for cell in worksheet['A']:
         cell.border = no_border
 
-    # Auto-size column widths
-    for column in worksheet.columns:
-        max_length = 0
-        column = [cell for cell in column]
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(cell.value)
-            except:
-                pass
+    # Auto-size column widths. The widths are computed from the data frame one column at a time
+    # with vectorized string operations, instead of reading back every cell of the worksheet.
+    table = df.reset_index() if index else df
+    # Iterate over the columns by position, since column names may be duplicated.
+    for column_number, (column, values) in enumerate(table.items(), start=1):
+        max_length = len(str(column))
+        if len(table) > 0:
+            max_length = max(max_length, int(values.astype(str).str.len().max()))
         adjusted_width = (max_length + 2)
-        worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
+        worksheet.column_dimensions[get_column_letter(column_number)].width = adjusted_width
 
     # Save the workbook
     writer.save()
@@ -99,6 +105,25 @@ class ClearView:
         self.processed_data_path = None
         self.stats_data_path = None
         self.table_name = 'data'
+        self.sqlite_chunk_rows = 10000
+        self.export_futures = []
+        self.export_locks = {}
+        self.latest_exports = {}
+        self.pending_exports = {}
+
+        # Cache of parsed files, in order of use
+        self.data_cache = OrderedDict()
+        self.data_cache_size = 8
+        self.df = None
+        self.df_processed = None
+
+        # Processed data of the current data, by analysis method
+        self.processed_data_cache = {}
+
+        # Tables, created when the first file is opened and reused for the following files
+        self.data_table = None
+        self.stats_table = None
+        self.processed_data_table = None
 
         # Set default number of rows to skip when reading input files
         self.skiprows = 3
@@ -111,6 +136,9 @@ class ClearView:
         self.app_width = 1200
         self.app_height = 700
 
+        # Number of rows of the data tables sent to the browser at a time
+        self.table_page_size = 200
+
         # Start Year for CE-QUAL-W2 plots
         self.start_year = datetime.datetime.today().year
 
@@ -165,85 +193,89 @@ class ClearView:
 
     def create_plot_widget(self):
         ''' Create plot widget '''
-        # Get the index of the df.columns list
-        index = self.df.columns.tolist().index(self.data_dropdown.value)
-
-        # Create a panel with the plot and the dropdown widget
-        selected_column = self.data_dropdown.value
-        self.plot = pn.pane.HoloViews(self.curves[selected_column])
-        tip = self.tooltips[selected_column]
-        self.plot.object.opts(tools=[tip])  # Add the HoverTool to the plot
+        # Create a panel with the plot and the dropdown widget. The plot is a DynamicMap bound to the
+        # dropdown, so selecting another variable updates the data of the existing plot in place
+        # instead of replacing the whole plot. About two points per horizontal pixel are sent to the browser.
+        curve = hv.DynamicMap(pn.bind(self.get_curve, self.data_dropdown))
+        self.plot = pn.pane.HoloViews(w2.hv_downsample(curve, 2 * self.app_width))
         # self.theme_dropdown.param.watch(self.recreate_plot, 'value')
-        self.data_dropdown.param.watch(self.update_plot, 'value')
         self.analysis_dropdown.param.watch(self.update_processed_data_table, 'value')
 
     def update_data_tab(self):
         ''' Create the Data tab '''
-        self.data_tab.clear()
-        self.data_tab.append(self.data_table)
-        self.data_tab.append(self.save_original_data_button)
+        self.data_tab.objects = [self.data_table, self.save_original_data_button]
 
     def update_stats_tab(self):
         ''' Create the Stats tab '''
-        self.stats_tab.clear()
-        self.stats_tab.append(self.stats_table)
-        self.stats_tab.append(self.save_stats_button)
+        self.stats_tab.objects = [self.stats_table, self.save_stats_button]
 
     def update_plot_tab(self):
         ''' Create the Plot tab '''
-        self.plot_tab.clear()
-        self.plot_tab.append(self.data_dropdown)
-        # self.plot_tab.append(self.theme_dropdown)
-        self.plot_tab.append(self.plot)
+        # self.plot_tab.objects = [self.data_dropdown, self.theme_dropdown, self.plot]
+        self.plot_tab.objects = [self.data_dropdown, self.plot]
 
     def update_methods_tab(self):
         ''' Create Methods tab '''
-        self.methods_tab.clear()
-        self.methods_tab.append(self.analysis_dropdown)
-        self.methods_tab.append(self.processed_data_table)
-        self.methods_tab.append(self.save_processed_data_button)
+        self.methods_tab.objects = [self.analysis_dropdown, self.processed_data_table, self.save_processed_data_button]
 
     def create_data_table(self):
         ''' Create the data table using a Tabulator widget '''
-        # Specify column formatters
-        self.float_cols = self.df.columns
+        # Specify column formatters. The numeric columns are found once, when the data are loaded, and the
+        # number format is only applied to them, so that text columns are not displayed as NaN.
+        self.float_cols = self.df.select_dtypes(include='number').columns
         self.bokeh_formatters = {col: self.float_format for col in self.float_cols}
-        header_align = {col: 'center' for col in self.df.columns}
+        # The stats and processed data tables have the same columns as the data, so they share the header alignment
+        self.header_align = {col: 'center' for col in self.df.columns}
 
         # Specify column formatters
-
-        # Create the data table using a Tabulator widget
-        self.data_table = pn.widgets.Tabulator(
-            self.df,
-            configuration={
-                'formatters': self.bokeh_formatters,
-                'frozen_columns': ['Date'],
-                'show_index': True,
-                'header_align': header_align,
-                'text_align': {},
-                'titles': {},
-                'width': self.app_width,
-                'height': self.app_height,
-                'clipboard': True,
-                'clipboardPasteAction': 'replace',
-                # 'rowHeight': 20,
-                'columnDefaults': {
-                    'headerSort': False
-                }
+        configuration = {
+            'formatters': self.bokeh_formatters,
+            'frozen_columns': ['Date'],
+            'show_index': True,
+            'header_align': self.header_align,
+            'text_align': {},
+            'titles': {},
+            'width': self.app_width,
+            'height': self.app_height,
+            'clipboard': True,
+            'clipboardPasteAction': 'replace',
+            # 'rowHeight': 20,
+            'columnDefaults': {
+                'headerSort': False
             }
-        )
+        }
+
+        # Create the data table using a Tabulator widget. The configuration depends only on the columns and
+        # their data types (the number format is only applied to the numeric columns), so if a table with the
+        # same columns and data types already exists, only its data are updated and the browser keeps the
+        # existing table instead of building a new one.
+        if (self.data_table is not None and self.data_table.value.columns.equals(self.df.columns)
+                and self.data_table.value.dtypes.equals(self.df.dtypes)):
+            self.data_table.value = self.df
+        else:
+            self.data_table = pn.widgets.Tabulator(
+                self.df, configuration=configuration, pagination='remote', page_size=self.table_page_size)
+            self.data_table.on_edit(self.edit_data)
 
-    def create_stats_table(self):
-        ''' Create the stats table using a Tabulator widget '''
+    def create_stats_table(self, df_stats=None):
+        ''' Create the stats table using a Tabulator widget, computing the summary statistics if they are not given '''
 
         # Compute summary statistics
-        self.df_stats = self.df.describe()
+        if df_stats is None:
+            df_stats = w2.summary_statistics(self.df)
+        self.df_stats = df_stats
         self.df_stats.index.name = 'Statistic'
 
         # Specify column formatters
         text_align = {}
         titles = {}
-        header_align = {col: 'center' for col in self.df_stats.columns}
+
+        # Update the existing stats table, if there is one
+        if self.stats_table is not None:
+            self.stats_table.param.update(
+                value=self.df_stats, formatters=self.bokeh_formatters, header_align=self.header_align
+            )
+            return
 
         # Create the stats table using a Tabulator widget
         self.stats_table = pn.widgets.Tabulator(
@@ -253,7 +285,7 @@ class ClearView:
             frozen_columns=['Statistic'],
             show_index=True,
             titles=titles,
-            header_align=header_align,
+            header_align=self.header_align,
             width=self.app_width,
             height=250,
             background=self.background_color,
@@ -262,42 +294,76 @@ class ClearView:
     def create_processed_data_table(self):
         ''' Create the processed data table using a Tabulator widget '''
 
-        # Set the default processed data table
-        self.df_processed = self.time_series_methods['Hourly Mean'](self.df)
+        # The processed data are computed on demand, when the Methods tab is shown or the processed
+        # data are saved. Start with an empty table that has the same columns as the data.
+        self.df_processed = None
+        self.processed_data_cache = {}
 
         # Specify column formatters
         text_align = {}
         titles = {}
-        header_align = {col: 'center' for col in self.df_processed.columns}
+
+        # Update the existing processed data table, if there is one
+        if self.processed_data_table is not None:
+            self.processed_data_table.param.update(
+                value=self.df.iloc[0:0], formatters=self.bokeh_formatters, header_align=self.header_align
+            )
+            return
 
         # Create the processed data table using a Tabulator widget
         self.processed_data_table = pn.widgets.Tabulator(
-            self.df_processed,
+            self.df.iloc[0:0],
             formatters=self.bokeh_formatters,
             text_align=text_align,
             frozen_columns=['Date'],
             show_index=True,
             titles=titles,
-            header_align=header_align,
+            header_align=self.header_align,
             width=self.app_width,
             height=self.app_height,
-            background=self.background_color
+            background=self.background_color,
+            pagination='remote',
+            page_size=self.table_page_size
         )
 
-    # Define a callback function to update the plot when the data dropdown value changes
-    def update_plot(self, event):
-        selected_column = self.data_dropdown.value
-        index = self.df.columns.tolist().index(self.data_dropdown.value)
+    # Define a callback function that returns the curve of the variable selected in the data dropdown
+    def get_curve(self, selected_column):
         curve = self.curves[selected_column]
         tip = self.tooltips[selected_column]
-        curve.opts(tools=[tip])
-        self.plot.object = curve
+        curve.opts(tools=[tip])  # Add the HoverTool to the plot
+        return curve
+
+    def get_processed_data(self):
+        ''' Compute the processed data for the selected analysis method, if they have not been computed yet '''
+        if self.df_processed is None:
+            # Reuse the result if the method has already been applied to the current data
+            selected_analysis = self.analysis_dropdown.value
+            if selected_analysis not in self.processed_data_cache:
+                self.processed_data_cache[selected_analysis] = self.time_series_methods[selected_analysis](self.df)
+            self.df_processed = self.processed_data_cache[selected_analysis]
+            self.processed_data_table.value = self.df_processed
+        return self.df_processed
+
+    def methods_tab_is_active(self):
+        ''' Check whether the Methods tab is the active tab '''
+        return self.tabs.objects[self.tabs.active] is self.methods_tab
 
     # Define a callback function to update the processed data table when the analysis dropdown value changes
     def update_processed_data_table(self, event):
-        selected_analysis = self.analysis_dropdown.value
-        self.df_processed = self.time_series_methods[selected_analysis](self.df)
-        self.processed_data_table.value = self.df_processed
+        # Discard the previous result and only recompute it if it is being displayed
+        self.df_processed = None
+        if self.methods_tab_is_active():
+            self.get_processed_data()
+
+    # Define a callback function to discard the processed data when the data are edited in the data table
+    def edit_data(self, event):
+        self.processed_data_cache = {}
+        self.update_processed_data_table(event)
+
+    # Define a callback function to compute the processed data when the Methods tab is selected
+    def activate_tab(self, event):
+        if self.df is not None and self.methods_tab_is_active():
+            self.get_processed_data()
 
     def parse_year_csv(self, w2_control_file_path):
         """
@@ -316,9 +382,11 @@ class ClearView:
             csv_reader = csv.reader(f)
             for row in csv_reader:
                 rows.append(row)
-        for i, row in enumerate(rows):
-            if row[0].upper() == 'TMSTRT':
-                self.start_year = int(rows[i + 1][2])
+        # Index the rows by upper-cased card name so the TMSTRT card is a dictionary lookup
+        card_rows = {row[0].upper(): i for i, row in enumerate(rows) if row}
+        i = card_rows.get('TMSTRT')
+        if i is not None:
+            self.start_year = int(rows[i + 1][2])
 
     def parse_year_npt(self, w2_control_file_path):
         """
@@ -333,15 +401,16 @@ class ClearView:
         Args:
             w2_control_file_path (str): The file path to the NPT file.
         """
+        # Stream the file and stop at the time card, which is near the top of the control file
         with open(w2_control_file_path, 'r') as f:
-            lines = f.readlines()
-        for i, line in enumerate(lines):
-            line = line.strip().upper()
-            if line.startswith('TMSTR') or line.startswith('TIME'):
-                data_line = lines[i + 1]
-                year_str = data_line[24:].strip()
-                self.start_year = int(year_str)
-                self.start_year_input.setText(str(self.start_year))
+            for line in f:
+                line = line.strip().upper()
+                if line.startswith(('TMSTR', 'TIME')):
+                    data_line = next(f)
+                    year_str = data_line[24:].strip()
+                    self.start_year = int(year_str)
+                    self.start_year_input.setText(str(self.start_year))
+                    break
 
     def get_model_year(self):
         """
@@ -416,7 +485,7 @@ class ClearView:
 
     def open_file(self, event):
         '''Open a file for viewing and analysis'''
-        file_dialog = qtw.QFileDialog(self.open_dialog_app.activeModalWidget())
+        file_dialog = qtw.QFileDialog(self.app.activeModalWidget())
         file_dialog.setFileMode(qtw.QFileDialog.ExistingFile)
         file_dialog.setNameFilters(['All Files (*.*)', 'CSV Files (*.csv)', 'NPT Files (*.npt)',
                                     'OPT Files (*.opt)', 'Excel Files (*.xlsx *.xls)', 'SQLite Files (*.db)'])
@@ -433,15 +502,17 @@ class ClearView:
             print('basefilename = ', basefilename)
             print('extension = ', extension)
 
-            if extension.lower() in ['.npt', '.opt']:
+            # Compare the extension case-insensitively
+            extension = extension.lower()
+            if extension in ['.npt', '.opt']:
                 self.data_columns = w2.get_data_columns_fixed_width(self.file_path)
                 FILE_TYPE = 'ASCII'
-            elif extension.lower() == '.csv':
+            elif extension == '.csv':
                 self.data_columns = w2.get_data_columns_csv(self.file_path)
                 FILE_TYPE = 'ASCII'
-            elif extension.lower() == '.db':
+            elif extension == '.db':
                 FILE_TYPE = 'SQLITE'
-            elif extension.lower() == '.xlsx' or extension.lower() == '.xls':
+            elif extension in ['.xlsx', '.xls']:
                 FILE_TYPE = 'EXCEL'
             else:
                 # self.show_warning_dialog('Only *.csv, *.npt, *.opt, and *.db files are supported.')
@@ -458,12 +529,11 @@ class ClearView:
             self.skiprows = int(self.skiprows_input.value)
 
             try:
-                if FILE_TYPE == 'ASCII':
-                    self.df = w2.read(self.file_path, self.start_year, self.data_columns, skiprows=self.skiprows)
-                elif FILE_TYPE == 'SQLITE':
-                    self.df = w2.read_sqlite(self.file_path)
-                elif FILE_TYPE == 'EXCEL':
-                    self.df = w2.read_excel(self.file_path, skiprows=0) # Note: skiprows is not used for Excel files, since it's too fragile
+                self.df = self.read_file(FILE_TYPE)
+
+                # Compute the summary statistics on the background executor while the plot and the other
+                # widgets are created. The NumPy reductions release the GIL, so the two run in parallel.
+                stats_future = _stats_executor.submit(w2.summary_statistics, self.df)
 
                 # Create theme dropdown list
                 # self.create_theme_dropdown_widget()
@@ -481,14 +551,23 @@ class ClearView:
                 # Create tables and plot panel
                 self.create_plot_widget()
                 self.create_data_table()
-                self.create_stats_table()
+                try:
+                    df_stats = stats_future.result()
+                except Exception as e:
+                    print(f'An error occurred while computing the summary statistics of {self.filename}: {e}')
+                    df_stats = pd.DataFrame(index=w2.SUMMARY_STATISTICS)
+                self.create_stats_table(df_stats)
                 self.create_processed_data_table()
 
-                # Create new tabs
-                self.update_data_tab()
-                self.update_stats_tab()
-                self.update_plot_tab()
-                self.update_methods_tab()
+                # Create new tabs. Hold the updates so that they are sent to the browser together.
+                with pn.io.hold():
+                    self.update_data_tab()
+                    self.update_stats_tab()
+                    self.update_plot_tab()
+                    self.update_methods_tab()
+
+                    # Compute the processed data now if the Methods tab is already open
+                    self.activate_tab(None)
 
             except IOError:
                 # self.show_warning_dialog(f'An error occurred while opening {self.filename}')
@@ -496,28 +575,72 @@ class ClearView:
                 return
         file_dialog.close()
 
+    def read_file(self, file_type):
+        """
+        Reads the selected file, reusing the data if the same file was read before.
+
+        Parsed data are cached by file path, size, modification time, and the read options, so reopening
+        an unchanged file does not parse it again. A copy of the cached data is returned, so that edits
+        made in the app do not change the cache. Only the most recently read files are kept.
+
+        Args:
+            file_type (str): The type of the file ('ASCII', 'SQLITE', or 'EXCEL').
+
+        Returns:
+            pd.DataFrame: The data read from the file.
+        """
+        file_stat = os.stat(self.file_path)
+        cache_key = (self.file_path, file_stat.st_size, file_stat.st_mtime_ns, file_type, self.start_year,
+                     self.skiprows)
+
+        if cache_key in self.data_cache:
+            self.data_cache.move_to_end(cache_key)
+            return self.data_cache[cache_key].copy()
+
+        if file_type == 'ASCII':
+            df = w2.read(self.file_path, self.start_year, self.data_columns, skiprows=self.skiprows)
+        elif file_type == 'SQLITE':
+            df = w2.read_sqlite(self.file_path)
+        elif file_type == 'EXCEL':
+            df = w2.read_excel(self.file_path, skiprows=0) # Note: skiprows is not used for Excel files, since it's too fragile
+
+        self.data_cache[cache_key] = df
+        if len(self.data_cache) > self.data_cache_size:
+            self.data_cache.popitem(last=False)
+
+        return df.copy()
+
+    def resample(self, df, frequency):
+        ''' Resample the data, reusing the resampler of the same data and frequency so that the Mean, Max, and Min methods share the time bins '''
+        cached_df, resampler = self.resamplers.get(frequency, (None, None))
+        if cached_df is not df:
+            resampler = df.resample(frequency)
+            self.resamplers[frequency] = (df, resampler)
+        return resampler
+
     def set_time_series_methods(self):
         # Specify the time series math and stats methods
+        self.resamplers = {}
         self.time_series_methods = OrderedDict()
         # Compute hourly mean, interpolating to fill missing values
-        self.time_series_methods['Hourly Mean'] = lambda df: df.resample('H').mean().interpolate()
-        self.time_series_methods['Hourly Max'] = lambda df: df.resample('H').max().interpolate()
-        self.time_series_methods['Hourly Min'] = lambda df: df.resample('H').min().interpolate()
-        self.time_series_methods['Daily Mean'] = lambda df: df.resample('D').mean().interpolate()
-        self.time_series_methods['Daily Max'] = lambda df: df.resample('D').max().interpolate()
-        self.time_series_methods['Daily Min'] = lambda df: df.resample('D').min().interpolate()
-        self.time_series_methods['Weekly Mean'] = lambda df: df.resample('W').mean().interpolate()
-        self.time_series_methods['Weekly Max'] = lambda df: df.resample('W').max().interpolate()
-        self.time_series_methods['Weekly Min'] = lambda df: df.resample('W').min().interpolate()
-        self.time_series_methods['Monthly Mean'] = lambda df: df.resample('M').mean().interpolate()
-        self.time_series_methods['Monthly Max'] = lambda df: df.resample('M').max().interpolate()
-        self.time_series_methods['Monthly Min'] = lambda df: df.resample('M').min().interpolate()
-        self.time_series_methods['Annual Mean'] = lambda df: df.resample('Y').mean().interpolate()
-        self.time_series_methods['Annual Max'] = lambda df: df.resample('Y').max().interpolate()
-        self.time_series_methods['Annual Min'] = lambda df: df.resample('Y').min().interpolate()
-        self.time_series_methods['Decadal Mean'] = lambda df: df.resample('10Y').mean().interpolate()
-        self.time_series_methods['Decadal Max'] = lambda df: df.resample('10Y').max().interpolate()
-        self.time_series_methods['Decadal Min'] = lambda df: df.resample('10Y').min().interpolate()
+        self.time_series_methods['Hourly Mean'] = lambda df: self.resample(df, 'H').mean().interpolate()
+        self.time_series_methods['Hourly Max'] = lambda df: self.resample(df, 'H').max().interpolate()
+        self.time_series_methods['Hourly Min'] = lambda df: self.resample(df, 'H').min().interpolate()
+        self.time_series_methods['Daily Mean'] = lambda df: self.resample(df, 'D').mean().interpolate()
+        self.time_series_methods['Daily Max'] = lambda df: self.resample(df, 'D').max().interpolate()
+        self.time_series_methods['Daily Min'] = lambda df: self.resample(df, 'D').min().interpolate()
+        self.time_series_methods['Weekly Mean'] = lambda df: self.resample(df, 'W').mean().interpolate()
+        self.time_series_methods['Weekly Max'] = lambda df: self.resample(df, 'W').max().interpolate()
+        self.time_series_methods['Weekly Min'] = lambda df: self.resample(df, 'W').min().interpolate()
+        self.time_series_methods['Monthly Mean'] = lambda df: self.resample(df, 'M').mean().interpolate()
+        self.time_series_methods['Monthly Max'] = lambda df: self.resample(df, 'M').max().interpolate()
+        self.time_series_methods['Monthly Min'] = lambda df: self.resample(df, 'M').min().interpolate()
+        self.time_series_methods['Annual Mean'] = lambda df: self.resample(df, 'Y').mean().interpolate()
+        self.time_series_methods['Annual Max'] = lambda df: self.resample(df, 'Y').max().interpolate()
+        self.time_series_methods['Annual Min'] = lambda df: self.resample(df, 'Y').min().interpolate()
+        self.time_series_methods['Decadal Mean'] = lambda df: self.resample(df, '10Y').mean().interpolate()
+        self.time_series_methods['Decadal Max'] = lambda df: self.resample(df, '10Y').max().interpolate()
+        self.time_series_methods['Decadal Min'] = lambda df: self.resample(df, '10Y').min().interpolate()
         self.time_series_methods['Cumulative Sum'] = lambda df: df.cumsum()
         self.time_series_methods['Cumulative Max'] = lambda df: df.cummax()
         self.time_series_methods['Cumulative Min'] = lambda df: df.cummin()
@@ -528,29 +651,116 @@ class ClearView:
         # self.time_series_methods['24-hour EWMA'] = lambda df: df.ewm(span=24).mean()
         # self.time_series_methods['7-day EWMA']   = lambda df: df.ewm(span=7).mean()
 
-        # # Compute exponential smoothing
+        # # Compute exponential smoothing. Import statsmodels here, when the method is used, since it
+        # # is slow to import and is not needed otherwise.
+        # from statsmodels.tsa.holtwinters import ExponentialSmoothing
         # model = ExponentialSmoothing(df, trend='add', seasonal=None)
         # result = model.fit()
         # df['Exponential Smoothing'] = result.fittedvalues
 
-    def save_to_sqlite(self, df: pd.DataFrame, database_path: str):
+    def submit_export(self, path, export_function, *args, **kwargs):
+        """
+        Runs an export function on the background executor.
+
+        The export is submitted to the module-level thread pool and the returned future is kept in
+        `self.export_futures` so that the status of pending exports can be queried. Any exception
+        raised by the export is printed when the future completes.
+
+        Exports to the same file are run one after the other: each export starts only after the
+        previous export to that file has finished, so repeated saves never write the same file at once.
+        An export that is still waiting when a newer export to the same file is submitted is skipped,
+        since its output would be overwritten anyway. If it has not left the thread pool queue yet, it
+        is cancelled so that it does not occupy a worker at all.
+
+        Args:
+            path (str): The path of the output file.
+            export_function (callable): The function that writes the output file.
+            *args: Positional arguments passed to `export_function`.
+            **kwargs: Keyword arguments passed to `export_function`.
+
+        Returns:
+            concurrent.futures.Future: The future representing the pending export.
+        """
+        lock = self.export_locks.setdefault(path, threading.Lock())
+        token = object()
+        self.latest_exports[path] = token
+
+        def export():
+            with lock:
+                if self.latest_exports.get(path) is not token:
+                    return
+                export_function(*args, **kwargs)
+
+        previous = self.pending_exports.get(path)
+        if previous is not None:
+            previous.cancel()
+
+        future = _executor.submit(export)
+        self.export_futures.append(future)
+        self.pending_exports[path] = future
+
+        def report(completed):
+            self.export_futures.remove(completed)
+            if self.pending_exports.get(path) is completed:
+                del self.pending_exports[path]
+            if completed.cancelled():
+                return
+            error = completed.exception()
+            if error is not None:
+                print(f'An error occurred while saving: {error}')
+
+        future.add_done_callback(report)
+        return future
+
+    def save_to_sqlite(self, df: pd.DataFrame, database_path: str, table_name: str):
         """
         Saves the data to an SQLite database.
 
         This method saves the data stored in the `data` attribute to an SQLite database file specified by the `original_data_path` attribute.
-        The table name is set as the `filename` attribute.
+        The table name is given by the caller, since the export runs later on the background executor, after
+        which another file may have been opened.
         If the database file already exists, the table with the same name is replaced.
-        The data is saved with the index included as a column.
+        The data is saved with the index included as a column. The rows are written in chunks, so that only one
+        chunk at a time is converted to database rows in memory.
 
         Note:
             - The `data` attribute must be set with the data before calling this method.
             - The `original_data_path` attribute must be properly set with the path to the SQLite database file.
         """
-        self.table_name, _ = os.path.splitext(self.filename)
         con = sqlite3.connect(database_path)
-        df.to_sql(self.table_name, con, if_exists='replace', index=True)
+        df.to_sql(table_name, con, if_exists='replace', index=True, chunksize=self.sqlite_chunk_rows)
         con.close()
 
+    def export_dataframe(self, df, path, sheet_name):
+        """
+        Writes a data frame to a file on the background executor, in the format given by the file extension.
+
+        Excel (.xlsx), SQLite (.db), Parquet (.parquet), and Feather (.feather) files are supported. All the
+        save buttons export through this method. Feather files are Arrow IPC files, which are the fastest to
+        write and read back, since the columns are written in their binary form. Parquet files are compressed
+        with Zstandard, which makes smaller files than the default Snappy codec at a similar speed, and
+        Feather files with the faster LZ4 codec.
+
+        Args:
+            df (pd.DataFrame): The data frame to write.
+            path (str): The path of the output file.
+            sheet_name (str): The name of the worksheet, for Excel files.
+        """
+        # The export runs later on the thread pool. Write a copy of the data as they are now, so that edits
+        # made to the table in the meantime are not mixed into the file.
+        df = df.copy()
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.xlsx':
+            self.submit_export(path, write_dataframe_to_excel, df, path, index=True, sheet_name=sheet_name)
+        elif extension == '.db':
+            # Take the table name from the file that is open now, not from the file open when the export runs
+            self.table_name, _ = os.path.splitext(self.filename)
+            self.submit_export(path, self.save_to_sqlite, df, path, self.table_name)
+        elif extension == '.parquet':
+            self.submit_export(path, df.to_parquet, path, compression='zstd')
+        elif extension == '.feather':
+            self.submit_export(path, df.to_feather, path, compression='lz4')
+
     def save_data(self, event):
         """
         Saves the data to a selected file as an SQLite database.
@@ -568,19 +778,16 @@ class ClearView:
         options = qtw.QFileDialog.Options()
         # options |= qtw.QFileDialog.DontUseNativeDialog
         returned_path, _ = qtw.QFileDialog.getSaveFileName(
-            self.save_original_data_dialog_app.activeModalWidget(),
-            'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db)', options=options)
+            self.app.activeModalWidget(),
+            'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db);; Parquet Files (*.parquet);; Feather Files (*.feather)',
+            options=options)
         if not returned_path:
             return
 
         self.original_data_path = returned_path
 
         if self.original_data_path and self.df is not None:
-            if self.original_data_path.endswith('.xlsx'):
-                # self.df.to_excel(self.original_data_path, index=True)
-                write_dataframe_to_excel(self.df, self.original_data_path, index=True, sheet_name='Original Data')
-            if self.original_data_path.endswith('.db'):
-                self.save_to_sqlite(self.df, self.original_data_path)
+            self.export_dataframe(self.df, self.original_data_path, 'Original Data')
 
     def save_processed_data(self, event):
         """
@@ -599,20 +806,17 @@ class ClearView:
         options = qtw.QFileDialog.Options()
         # options |= qtw.QFileDialog.DontUseNativeDialog
         returned_path, _ = qtw.QFileDialog.getSaveFileName(
-            self.save_processed_data_dialog_app.activeModalWidget(),
-            'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db)', options=options)
+            self.app.activeModalWidget(),
+            'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db);; Parquet Files (*.parquet);; Feather Files (*.feather)',
+            options=options)
         if not returned_path:
             return
 
         self.processed_data_path = returned_path
 
-        if self.processed_data_path and self.df_processed is not None:
-            if self.processed_data_path.endswith('.xlsx'):
-                # self.df_processed.to_excel(self.processed_data_path, index=True)
-                write_dataframe_to_excel(self.df_processed, self.processed_data_path,
-                                         index=True, sheet_name='Processed Data')
-            if self.processed_data_path.endswith('.db'):
-                self.save_to_sqlite(self.df_processed, self.processed_data_path)
+        if self.processed_data_path and self.df is not None:
+            self.get_processed_data()
+            self.export_dataframe(self.df_processed, self.processed_data_path, 'Processed Data')
 
     def save_stats(self, event):
         """
@@ -626,19 +830,16 @@ class ClearView:
 
         default_filename = self.file_path + '_stats.xlsx'
         options = qtw.QFileDialog.Options()
-        returned_path, _ = qtw.QFileDialog.getSaveFileName(self.save_stats_dialog_app.activeModalWidget(
-        ), 'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db)', options=options)
+        returned_path, _ = qtw.QFileDialog.getSaveFileName(self.app.activeModalWidget(
+        ), 'Save As', default_filename, 'Excel Files (*.xlsx);; SQLite Files (*.db);; Parquet Files (*.parquet);; Feather Files (*.feather)',
+            options=options)
         if not returned_path:
             return
 
         self.stats_data_path = returned_path
 
         if self.stats_data_path and self.df_stats is not None:
-            if self.stats_data_path.endswith('.xlsx'):
-                # self.df_stats.to_excel(self.stats_data_path, index=True)
-                write_dataframe_to_excel(self.df_stats, self.stats_data_path, index=True, sheet_name='Summary Stats')
-            if self.stats_data_path.endswith('.db'):
-                self.save_to_sqlite(self.df_stats, self.stats_data_path)
+            self.export_dataframe(self.df_stats, self.stats_data_path, 'Summary Stats')
 
     def create_empty_tab(self):
         # empty_data = hv.Curve([])
@@ -699,15 +900,18 @@ class ClearView:
         '''Enable/disable the text input field based on dropdown selection'''
         if self.date_system_dropdown.value == 'Day of Year':
             self.date_system = 'Day of Year'
-            self.start_year_input.disabled = False
-            self.w2_find_start_year_checkbox.disabled = False
+            disabled = False
         elif self.date_system_dropdown.value == 'Standard Calendar':
             self.date_system = 'Standard Calendar'
-            self.start_year_input.disabled = True
-            self.w2_find_start_year_checkbox.disabled = True
+            disabled = True
         else:
             raise ValueError('Unrecognized option in the date system dropdown list.')
 
+        # Send both changes to the browser together
+        with pn.io.hold():
+            self.start_year_input.disabled = disabled
+            self.w2_find_start_year_checkbox.disabled = disabled
+
     def create_sidebar(self):
         sidebar_text = """
         <h2><font color="dodgerblue">ClearView</font>
@@ -782,21 +986,21 @@ class ClearView:
             ('Methods', self.methods_tab),
             ('About', self.about_tab),
             tabs_location='above',
+            # Only render the contents of the visible tab
+            dynamic=True,
             # background='blue',
             # sizing_mode='stretch_both',
             margin=(0, 0, 0, 0),
             css_classes=['panel-widget-box'],
         ).servable(title='ClearWater Insights')
+        self.tabs.param.watch(self.activate_tab, 'active')
 
         # Create Main Layout
         self.main = pn.Row(self.sidebar, self.tabs)
 
-        # Create a PyQt5 application
-        self.open_dialog_app = qtw.QApplication([])
-        self.save_original_data_dialog_app = qtw.QApplication([])
-        self.save_stats_dialog_app = qtw.QApplication([])
-        self.save_processed_data_dialog_app = qtw.QApplication([])
-        self.app = qtw.QApplication([])
+        # Create a PyQt5 application. Qt supports only one application per process, so the file
+        # dialogs share it, and an application that already exists is reused.
+        self.app = qtw.QApplication.instance() or qtw.QApplication([])
 
         # Serve the app
         self.main.show()
@@ -3,6 +3,7 @@ import sys
 import csv
 import glob
 import sqlite3
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -70,11 +71,20 @@ class ClearView(qtw.QMainWindow):
 
         self.file_path = ''
         self.data = None
+        self.stats = None
+        self.stats_are_current = False
+        self.pending_cell_changes = {}
+        self.data_table_chunk_cells = 10000
+        self.plot_data_cache = {}
+        self.data_table_fill_id = 0
         self.DEFAULT_YEAR = 2023
         self.year = self.DEFAULT_YEAR
         self.data_database_path = None
         self.stats_database_path = None
         self.table_name = 'data'
+        self.sqlite_chunk_rows = 10000
+        self.data_cache = OrderedDict()
+        self.data_cache_size = 8
         self.default_fig_width = 12
         self.default_fig_height = 4
 
@@ -258,21 +268,40 @@ class ClearView(qtw.QMainWindow):
         self.setCentralWidget(self.tab_widget)
 
         # Add a recent files list to the file menu
+        # The menu is rebuilt only when the list of recent files changes, not every time it is shown
         self.recent_files_menu = file_menu.addMenu('Recent Files')
-        self.recent_files_menu.aboutToShow.connect(self.update_recent_files_menu)
+        self.recent_files_menu.triggered.connect(self.recent_file_triggered)
+        self.update_recent_files_menu()
         
     def update_recent_files_menu(self):
         """
         Updates the recent files menu with the most recent files.
 
         This method updates the recent files menu with the most recent files.
+        Each file action stores its file path, and all the actions are handled by `recent_file_triggered`.
         """
         self.recent_files_menu.clear()
-        self.recent_files_menu.addAction('Clear Menu', self.clear_recent_files_menu)
+        self.recent_files_menu.addAction('Clear Menu')
         self.recent_files_menu.addSeparator()
         recent_files = self.get_recent_files()
         for file in recent_files:
-            self.recent_files_menu.addAction(file, lambda checked, file=file: self.open_recent_file(file))
+            action = self.recent_files_menu.addAction(file)
+            action.setData(file)
+
+    def recent_file_triggered(self, action):
+        """
+        Handles an action selected in the recent files menu.
+
+        This method opens the file stored in the action, or clears the menu if the action has no file.
+
+        Args:
+            action (QAction): The selected action.
+        """
+        file = action.data()
+        if file:
+            self.open_recent_file(file)
+        else:
+            self.clear_recent_files_menu()
 
     def clear_recent_files_menu(self):
         """
@@ -281,7 +310,6 @@ class ClearView(qtw.QMainWindow):
         This method clears the recent files menu.
         """
         self.set_recent_files([])
-        self.update_recent_files_menu()
 
     def get_recent_files(self):
         """
@@ -300,13 +328,14 @@ class ClearView(qtw.QMainWindow):
         """
         Sets the recent files in the settings.
 
-        This method sets the recent files in the settings.
+        This method sets the recent files in the settings and rebuilds the recent files menu.
 
         Args:
             recent_files (list): A list of recent files.
         """
         settings = qtc.QSettings()
         settings.setValue('recent_files', recent_files)
+        self.update_recent_files_menu()
 
     def update_stats_table(self):
         """
@@ -320,42 +349,44 @@ class ClearView(qtw.QMainWindow):
         The formatting of the statistics values depends on their type:
         - The "count" statistic is displayed as an integer.
         - Other statistics are displayed as floating-point numbers with two decimal places.
-        - If a value cannot be converted to a number, it is displayed as a string.
+
+        The statistics are computed once for each data set. They are computed again only after a file is opened
+        or the data are edited, which set `stats_are_current` to False.
 
         Note:
             - The number of columns in the statistics table is equal to the number of data columns plus one, accounting for the index column that lists the statistics names.
             - The `data` attribute must be set with the data before calling this method.
         """
-        if self.data is None:
+        if self.data is None or self.stats_are_current:
             return
 
-        self.stats = self.data.describe().reset_index()
+        self.stats = w2.summary_statistics(self.data).reset_index()
+        self.stats_are_current = True
         self.stats_table.setRowCount(len(self.stats))
-        self.stats_table.setColumnCount(len(self.data.columns) + 1)
+        self.stats_table.setColumnCount(len(self.stats.columns))
 
-        header = ['']
-        for col in self.data.columns:
-            header.append(col)
+        header = ['', *self.stats.columns[1:]]
         self.stats_table.setHorizontalHeaderLabels(header)
 
-        for row in range(len(self.stats)):
-            for col in range(len(self.data.columns) + 1):
-                value = self.stats.iloc[row, col]
-                try:
-                    if col == 0:
-                        value_text = str(value)
-                    elif row == 0:
-                        value_text = f'{int(value):d}'
-                    else:
-                        value_text = f'{value:.2f}'
-                except ValueError:
-                    value_text = str(value)
-                item = qtw.QTableWidgetItem(value_text)
-                item.setTextAlignment(0x0082)
-                self.stats_table.setItem(row, col, item)
+        # Format all of the statistics in one pass. The count is displayed as an integer.
+        values = self.stats.iloc[:, 1:].to_numpy(dtype=float)
+        values_text = np.char.mod('%.2f', values)
+        values_text[0] = np.char.mod('%d', values[0])
 
-        # Autofit the column widths
-        self.stats_table.resizeColumnsToContents()
+        # Fill the table with repainting turned off, so it is repainted once at the end instead of for every cell
+        self.stats_table.setUpdatesEnabled(False)
+        try:
+            for row, statistic in enumerate(self.stats.iloc[:, 0]):
+                row_text = [str(statistic), *values_text[row]]
+                for col, value_text in enumerate(row_text):
+                    item = qtw.QTableWidgetItem(value_text)
+                    item.setTextAlignment(0x0082)
+                    self.stats_table.setItem(row, col, item)
+
+            # Autofit the column widths
+            self.stats_table.resizeColumnsToContents()
+        finally:
+            self.stats_table.setUpdatesEnabled(True)
 
     def update_data_table(self):
         """
@@ -364,42 +395,81 @@ class ClearView(qtw.QMainWindow):
         This method takes the current data stored in the `data` attribute and updates the `data_table` widget accordingly.
 
         If the `data` attribute is not `None`, the method performs the following steps:
-        1. Converts the DataFrame to a numpy array for efficiency.
-        2. Converts the datetime index to a formatted string representation.
+        1. Converts the datetime index to a formatted string representation.
+        2. Formats the values of each column in one pass, with four decimal places for numeric columns.
         3. Sets the table headers with the formatted datetime index and column names.
-        4. Populates the table with the values from the numpy array, aligned and formatted.
+        4. Populates the table with the values from the numpy array, aligned and formatted, in chunks of rows
+           (see `fill_data_table_rows`).
 
         Note:
             This method assumes that the `data_table` widget has been properly initialized.
         """
         if self.data is not None:
-            array_data = self.data.values
-            datetime_index = self.data.index.to_series().dt.strftime('%m/%d/%Y %H:%M')
-            datetime_strings = datetime_index.tolist()
+            datetime_strings = self.format_dates(self.data.index)
+
+            # Format each numeric column in one pass over a contiguous array. Columns of other types
+            # (e.g., text) are displayed as they are.
+            number_rows, number_columns = self.data.shape
+            values_text = np.empty((number_rows, number_columns), dtype=object)
+            for column, (_, series) in enumerate(self.data.items()):
+                if pd.api.types.is_numeric_dtype(series):
+                    values_text[:, column] = np.char.mod('%.4f', series.to_numpy(dtype=float, na_value=np.nan))
+                else:
+                    values_text[:, column] = series.astype(str).to_numpy()
 
-            header = ['Date']
-            for col in self.data.columns:
-                header.append(col)
+            header = ['Date', *self.data.columns]
 
-            number_rows, number_columns = array_data.shape
             self.data_table.setRowCount(number_rows)
             self.data_table.setColumnCount(number_columns + 1)
             self.data_table.setHorizontalHeaderLabels(header)
 
-            for row in range(number_rows):
-                for column in range(number_columns + 1):
-                    if column == 0:
-                        item = qtw.QTableWidgetItem(datetime_strings[row])
-                        item.setTextAlignment(0x0082)
-                    else:
-                        value = array_data[row, column - 1]
-                        value_text = f'{value:.4f}'
-                        item = qtw.QTableWidgetItem(value_text)
-                        item.setTextAlignment(0x0082)
-                    self.data_table.setItem(row, column, item)
+            # Fill the first rows now and the rest in chunks from the event loop, so that the table is shown
+            # right away and the window stays responsive while a long time series is filled in
+            self.data_table_fill_id += 1
+            self.fill_data_table_rows(self.data_table_fill_id, datetime_strings, values_text, 0)
         # Autofit the column widths
         self.data_table.resizeColumnsToContents()
 
+    def fill_data_table_rows(self, fill_id, datetime_strings, values_text, start):
+        """
+        Fills a chunk of rows of the data table and schedules the next chunk.
+
+        Each chunk has about `data_table_chunk_cells` cells, so a table with many columns is filled in chunks of
+        fewer rows and the window stays responsive however wide the data are. Chunks of a fill that has been
+        replaced by a newer call to `update_data_table` are discarded.
+
+        Args:
+            fill_id (int): The number of the fill that this chunk belongs to.
+            datetime_strings (list): The formatted dates of all rows.
+            values_text (numpy.ndarray): The formatted values of all rows.
+            start (int): The first row of the chunk.
+        """
+        if fill_id != self.data_table_fill_id:
+            return
+
+        chunk_rows = max(1, self.data_table_chunk_cells // (values_text.shape[1] + 1))
+        stop = min(start + chunk_rows, len(datetime_strings))
+
+        # Fill the rows with repainting turned off, so the table is repainted once per chunk instead of for every cell.
+        # Signals are blocked as well: setting an item emits itemChanged, and the values being displayed are not
+        # edits that need to be written back to the data.
+        self.data_table.setUpdatesEnabled(False)
+        signals_blocked = self.data_table.blockSignals(True)
+        try:
+            for row in range(start, stop):
+                row_text = [datetime_strings[row], *values_text[row]]
+                for column, value_text in enumerate(row_text):
+                    item = qtw.QTableWidgetItem(value_text)
+                    item.setTextAlignment(0x0082)
+                    self.data_table.setItem(row, column, item)
+        finally:
+            self.data_table.blockSignals(signals_blocked)
+            self.data_table.setUpdatesEnabled(True)
+
+        if stop < len(datetime_strings):
+            qtc.QTimer.singleShot(
+                0, lambda: self.fill_data_table_rows(fill_id, datetime_strings, values_text, stop))
+
     def parse_year_csv(self, w2_control_file_path):
         """
         Parses the year from a CSV file and sets it as the year attribute.
@@ -417,10 +487,12 @@ class ClearView(qtw.QMainWindow):
             csv_reader = csv.reader(f)
             for row in csv_reader:
                 rows.append(row)
-        for i, row in enumerate(rows):
-            if row[0].upper() == 'TMSTRT':
-                self.year = int(rows[i + 1][2])
-                self.start_year_input.setText(str(self.year))
+        # Index the rows by upper-cased card name so the TMSTRT card is a dictionary lookup
+        card_rows = {row[0].upper(): i for i, row in enumerate(rows) if row}
+        i = card_rows.get('TMSTRT')
+        if i is not None:
+            self.year = int(rows[i + 1][2])
+            self.start_year_input.setText(str(self.year))
 
     def parse_year_npt(self, w2_control_file_path):
         """
@@ -435,15 +507,16 @@ class ClearView(qtw.QMainWindow):
         Args:
             w2_control_file_path (str): The file path to the NPT file.
         """
+        # Stream the file and stop at the time card, which is near the top of the control file
         with open(w2_control_file_path, 'r') as f:
-            lines = f.readlines()
-        for i, line in enumerate(lines):
-            line = line.strip().upper()
-            if line.startswith('TMSTR') or line.startswith('TIME'):
-                data_line = lines[i + 1]
-                year_str = data_line[24:].strip()
-                self.year = int(year_str)
-                self.start_year_input.setText(str(self.year))
+            for line in f:
+                line = line.strip().upper()
+                if line.startswith(('TMSTR', 'TIME')):
+                    data_line = next(f)
+                    year_str = data_line[24:].strip()
+                    self.year = int(year_str)
+                    self.start_year_input.setText(str(self.year))
+                    break
 
     def get_model_year(self):
         """
@@ -556,15 +629,17 @@ class ClearView(qtw.QMainWindow):
             self.filename_input.setText(self.filename)
             basefilename, extension = os.path.splitext(self.filename)
 
-            if extension.lower() in ['.npt', '.opt']:
+            # Compare the extension case-insensitively
+            extension = extension.lower()
+            if extension in ['.npt', '.opt']:
                 self.data_columns = w2.get_data_columns_fixed_width(self.file_path)
                 FILE_TYPE = 'ASCII'
-            elif extension.lower() == '.csv':
+            elif extension == '.csv':
                 self.data_columns = w2.get_data_columns_csv(self.file_path)
                 FILE_TYPE = 'ASCII'
-            elif extension.lower() == '.db':
+            elif extension == '.db':
                 FILE_TYPE = 'SQLITE'
-            elif extension.lower() == '.xlsx' or extension.lower() == '.xls':
+            elif extension in ['.xlsx', '.xls']:
                 FILE_TYPE = 'EXCEL'
             else:
                 file_dialog.close()
@@ -574,23 +649,55 @@ class ClearView(qtw.QMainWindow):
             self.get_model_year()
 
             try:
-                if FILE_TYPE == 'ASCII':
-                    self.data = w2.read(self.file_path, self.year, self.data_columns)
-                elif FILE_TYPE == 'SQLITE':
-                    self.data = w2.read_sqlite(self.file_path)
-                elif FILE_TYPE == 'EXCEL':
-                    self.data = w2.read_excel(self.file_path)
-                    # first_column_name = self.data.columns[0]
-                    # self.data.rename(columns={f'{first_column_name}': 'Date'}, inplace=True)
-                    # self.data['Date'] = pd.to_datetime(self.data['Date'], format='%m/%d/%Y %H:%M')
-                    # self.data.set_index('Date', inplace=True)
+                self.data = self.read_file(FILE_TYPE)
             except IOError:
                 self.show_warning_dialog(f'An error occurred while opening {self.filename}')
                 file_dialog.close()
 
+            self.stats_are_current = False
+            self.plot_data_cache = {}
+
         self.update_data_table()
         self.update_stats_table()
 
+    def read_file(self, file_type):
+        """
+        Reads the selected file, reusing the data if the same file was read before.
+
+        Parsed data are cached by file path, size, modification time, file type, and model year, so reopening
+        an unchanged file does not parse it again. A copy of the cached data is returned, so that edits
+        made in the data table do not change the cache. Only the most recently read files are kept.
+
+        Args:
+            file_type (str): The type of the file ('ASCII', 'SQLITE', or 'EXCEL').
+
+        Returns:
+            pd.DataFrame: The data read from the file.
+        """
+        file_stat = os.stat(self.file_path)
+        cache_key = (self.file_path, file_stat.st_size, file_stat.st_mtime_ns, file_type, self.year)
+
+        if cache_key in self.data_cache:
+            self.data_cache.move_to_end(cache_key)
+            return self.data_cache[cache_key].copy()
+
+        if file_type == 'ASCII':
+            df = w2.read(self.file_path, self.year, self.data_columns)
+        elif file_type == 'SQLITE':
+            df = w2.read_sqlite(self.file_path)
+        elif file_type == 'EXCEL':
+            df = w2.read_excel(self.file_path)
+            # first_column_name = df.columns[0]
+            # df.rename(columns={f'{first_column_name}': 'Date'}, inplace=True)
+            # df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y %H:%M')
+            # df.set_index('Date', inplace=True)
+
+        self.data_cache[cache_key] = df
+        if len(self.data_cache) > self.data_cache_size:
+            self.data_cache.popitem(last=False)
+
+        return df.copy()
+
     def resize_canvas(self, fig_width, fig_height):
         """
         Resize canvas, converting figure width and height in inches to pixels.
@@ -609,10 +716,52 @@ class ClearView(qtw.QMainWindow):
         canvas_height = int(default_dpi * fig_height)
         self.canvas.resize(canvas_width, canvas_height)
 
+    def format_dates(self, index):
+        """
+        Formats the dates of a DatetimeIndex as MM/DD/YYYY HH:MM strings.
+
+        Timezone-naive dates without missing values are converted to ISO 8601 strings with NumPy, and their
+        characters are rearranged as a fixed-width character array, which is much faster than formatting each date
+        with strftime. Other indexes are formatted with strftime.
+
+        Args:
+            index (pd.DatetimeIndex): The dates to format.
+
+        Returns:
+            list: The formatted dates.
+        """
+        if not isinstance(index, pd.DatetimeIndex) or index.tz is not None or index.hasnans:
+            return index.to_series().dt.strftime('%m/%d/%Y %H:%M').tolist()
+
+        # Character positions of MM/DD/YYYY HH:MM in YYYY-MM-DDTHH:MM
+        iso_dates = np.datetime_as_string(index.to_numpy(), unit='m').astype('U16')
+        characters = iso_dates.view('U1').reshape(len(iso_dates), 16)
+        characters = characters[:, [5, 6, 4, 8, 9, 4, 0, 1, 2, 3, 10, 11, 12, 13, 14, 15]]
+        characters[:, [2, 5]] = '/'
+        characters[:, 10] = ' '
+        return np.ascontiguousarray(characters).view('U16').ravel().tolist()
+
+    def max_plot_points(self):
+        """
+        Returns the number of points to plot per column: about two per horizontal pixel of the canvas.
+        """
+        return 2 * int(mpl.rcParams['figure.dpi'] * self.default_fig_width)
+
+    def get_plot_data(self):
+        """
+        Returns the data downsampled for plotting (see `max_plot_points`).
+
+        The downsampled data are reused by the plots until a file is opened or the data are edited, which clear
+        `plot_data_cache`, so switching between the plot types does not downsample the data again.
+        """
+        max_points = self.max_plot_points()
+        if max_points not in self.plot_data_cache:
+            self.plot_data_cache[max_points] = w2.lttb_downsample(self.data, max_points)
+        return self.plot_data_cache[max_points]
+
     def clear_figure_and_canvas(self):
-        self.canvas.figure.clear()
+        # The canvas draws self.figure, so clearing the figure once also clears the canvas
         self.figure.clear()
-        self.figure.clf()
 
     def plot(self):
         # Check if data is available
@@ -623,11 +772,13 @@ class ClearView(qtw.QMainWindow):
         self.clear_figure_and_canvas()
         plot_scale_factor = 1.5
         canvas_height = plot_scale_factor * self.default_fig_height
-        w2.plot(self.data, fig=self.figure, figsize=(self.default_fig_width, self.default_fig_height))
+        w2.plot(self.get_plot_data(), fig=self.figure, figsize=(self.default_fig_width, self.default_fig_height))
         self.resize_canvas(self.default_fig_width, canvas_height)
 
-        # Draw the canvas and create or update the statistics table
-        self.canvas.draw()
+        # Schedule the canvas to be drawn and create or update the statistics table. draw_idle renders
+        # once the event loop is idle, and merges with the redraw requested by the canvas resize,
+        # so the figure is rendered once instead of twice and the window stays responsive meanwhile.
+        self.canvas.draw_idle()
         self.update_stats_table()
 
     def multi_plot(self):
@@ -640,11 +791,13 @@ class ClearView(qtw.QMainWindow):
         subplot_scale_factor = 2.0
         num_subplots = len(self.data.columns)
         multi_plot_fig_height = max(num_subplots * subplot_scale_factor, self.default_fig_height)
-        w2.multi_plot(self.data, fig=self.figure, figsize=(self.default_fig_width, multi_plot_fig_height))
+        w2.multi_plot(self.get_plot_data(), fig=self.figure, figsize=(self.default_fig_width, multi_plot_fig_height))
         self.resize_canvas(self.default_fig_width, multi_plot_fig_height)
 
-        # Draw the canvas and create or update the statistics table
-        self.canvas.draw()
+        # Schedule the canvas to be drawn and create or update the statistics table. draw_idle renders
+        # once the event loop is idle, and merges with the redraw requested by the canvas resize,
+        # so the figure is rendered once instead of twice and the window stays responsive meanwhile.
+        self.canvas.draw_idle()
         self.update_stats_table()
 
     def show_warning_dialog(self, message):
@@ -668,29 +821,56 @@ class ClearView(qtw.QMainWindow):
         Handles the change in a table cell value.
 
         This method is triggered when a cell value in the table widget (`self.data_table`) is changed.
-        If the `data` attribute is not `None`, the method retrieves the row, column, and new value of the changed cell.
-        If the column index is 0, it attempts to convert the value to a datetime object using the specified format.
-        Otherwise, it attempts to convert the value to a float and updates the corresponding value in the `data` DataFrame.
+        Edits arrive once per cell, so a paste or a table refresh can emit thousands of them in a row.
+        Instead of updating the `data` DataFrame for each one, the row, column, and new value are queued
+        and applied together by `apply_cell_changes` once control returns to the event loop. Only the
+        latest value of each cell is kept.
 
         Note:
             - The table widget (`self.data_table`) must be properly set up and connected to this method.
             - The `data` attribute must be set with the data before calling this method.
         """
         if self.data is not None:
-            row = item.row()
-            col = item.column()
-            value = item.text()
+            if not self.pending_cell_changes:
+                qtc.QTimer.singleShot(0, self.apply_cell_changes)
+            self.pending_cell_changes[(item.row(), item.column())] = item.text()
+
+    def apply_cell_changes(self):
+        """
+        Applies the queued table cell changes to the data.
 
+        For each queued change, if the column index is 0, it attempts to convert the value to a datetime object
+        using the specified format. Otherwise, it attempts to convert the value to a float. The converted values are
+        grouped by column and written to the `data` DataFrame with one assignment per column, instead of one `iloc`
+        assignment per cell, which is much faster when a large block of cells is pasted.
+        """
+        changes = self.pending_cell_changes
+        self.pending_cell_changes = {}
+        if self.data is None:
+            return
+        self.stats_are_current = False
+        self.plot_data_cache = {}
+
+        number_rows, number_columns = self.data.shape
+        column_changes = {}
+        for (row, col), value in changes.items():
             try:
                 if col == 0:
                     datetime_index = pd.to_datetime(value, format='%m/%d/%Y %H:%M')
                 else:
-                    self.data.iloc[row, col - 1] = float(value)
+                    if row >= number_rows or col > number_columns:
+                        raise IndexError
+                    rows, values = column_changes.setdefault(col - 1, ([], []))
+                    values.append(float(value))
+                    rows.append(row)
             except ValueError:
                 print('ValueError:', row, col, value)
             except IndexError:
                 print('IndexError:', row, col, value)
 
+        for column, (rows, values) in column_changes.items():
+            self.data.iloc[rows, column] = values
+
     def save_to_sqlite(self, df: pd.DataFrame, database_path: str):
         """
         Saves the data to an SQLite database.
@@ -698,7 +878,8 @@ class ClearView(qtw.QMainWindow):
         This method saves the data stored in the `data` attribute to an SQLite database file specified by the `data_database_path` attribute.
         The table name is set as the `filename` attribute.
         If the database file already exists, the table with the same name is replaced.
-        The data is saved with the index included as a column.
+        The data is saved with the index included as a column. The rows are written in chunks, so that only one
+        chunk at a time is converted to database rows in memory.
 
         Note:
             - The `data` attribute must be set with the data before calling this method.
@@ -706,7 +887,7 @@ class ClearView(qtw.QMainWindow):
         """
         self.table_name, _ = os.path.splitext(self.filename)
         con = sqlite3.connect(database_path)
-        df.to_sql(self.table_name, con, if_exists="replace", index=True)
+        df.to_sql(self.table_name, con, if_exists="replace", index=True, chunksize=self.sqlite_chunk_rows)
         con.close()
 
     def save_data(self):
@@ -794,12 +975,13 @@ class ClearView(qtw.QMainWindow):
 
         selected = table_widget.selectedRanges()
         if selected:
-            s = ''
+            # Collect the rows and join them once, instead of growing the string cell by cell
+            columns = range(selected[0].leftColumn(), selected[0].rightColumn() + 1)
+            lines = []
             for row in range(selected[0].topRow(), selected[0].bottomRow() + 1):
-                for col in range(selected[0].leftColumn(), selected[0].rightColumn() + 1):
-                    s += str(table_widget.item(row, col).text()) + '\t'
-                s = s.strip() + '\n'
-            s = s.strip()
+                items = (table_widget.item(row, col) for col in columns)
+                lines.append('\t'.join(item.text() if item is not None else '' for item in items).strip())
+            s = '\n'.join(lines).strip()
             qtw.QApplication.clipboard().setText(s)
 
     def paste_data(self):
@@ -830,12 +1012,13 @@ class ClearView(qtw.QMainWindow):
             top_row = selected[0].topRow()
             left_col = selected[0].leftColumn()
 
-            for i, row in enumerate(range(nrows)):
-                row = top_row + i
-                for j, col in enumerate(range(ncols)):
-                    col = left_col + j
-                    if row < maxrow and col < maxcol:
-                        table_widget.setItem(row, col, qtw.QTableWidgetItem(values[i][j]))
+            # Clip the pasted block to the table bounds once, instead of checking every cell
+            nrows = max(0, min(nrows, maxrow - top_row))
+            ncols = max(0, min(ncols, maxcol - left_col))
+
+            for i in range(nrows):
+                for j in range(ncols):
+                    table_widget.setItem(top_row + i, left_col + j, qtw.QTableWidgetItem(values[i][j]))
 
 
 if __name__ == '__main__':
@@ -50,4 +50,5 @@ input data requirements, and model applications.
 from .w2_datetime import *
 from .w2_io import *
 from .w2_reports import *
+from .w2_statistics import *
 from .w2_visualization import *
\ No newline at end of file
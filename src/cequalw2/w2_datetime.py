@@ -1,5 +1,10 @@
 import datetime
 from typing import List
+import numpy as np
+import pandas as pd
+
+SECONDS_PER_DAY = 86400
+MICROSECONDS_PER_DAY = SECONDS_PER_DAY * 1_000_000
 
 
 def round_time(date_time: datetime.datetime = None, round_to: int = 60) -> datetime.datetime:
@@ -24,30 +29,39 @@ def round_time(date_time: datetime.datetime = None, round_to: int = 60) -> datet
     return date_time + datetime.timedelta(0, rounding - seconds)
 
 
-def day_of_year_to_datetime(year: int, day_of_year_list: List[int]) -> List[datetime.datetime]:
+def day_of_year_to_datetime(year: int, day_of_year_list: List[float]) -> pd.DatetimeIndex:
     """
     Convert a list of day-of-year values to datetime objects.
 
+    The conversion is vectorized. Each date-time is rounded to the nearest hour, in the same way as
+    round_time() with round_to=3600.
+
     :param year: The start year of the data.
     :type year: int
-    :param day_of_year_list: A list of day-of-year values (e.g., from CE-QUAL-W2).
+    :param day_of_year_list: A list or array of day-of-year values (e.g., from CE-QUAL-W2).
     :type day_of_year_list: list
-    :return: A list of datetime objects corresponding to the day-of-year values.
-    :rtype: List[datetime.datetime]
+    :return: The date-times corresponding to the day-of-year values.
+    :rtype: pd.DatetimeIndex
+    :raises ValueError: If any day-of-year value is missing (NaN) or infinite.
     """
 
-    day1 = datetime.datetime(year, 1, 1, 0, 0, 0)
-    datetimes = []
-    for d in day_of_year_list:
-        try:
-            d = float(d)
-            time_diff = day1 + datetime.timedelta(days=d - 1)
-        except TypeError:
-            print(f'Type Error! d = {d}, type(d) = {type(d)}')
-
-        time_diff = round_time(date_time=time_diff, round_to=60 * 60)
-        datetimes.append(time_diff)
-    return datetimes
+    days = np.asarray(day_of_year_list, dtype=np.float64)
+
+    # Casting NaN or infinity to int64 gives meaningless offsets, so reject them before the conversion
+    not_finite = ~np.isfinite(days)
+    if not_finite.any():
+        raise ValueError(f'Day-of-year values must be finite; found {not_finite.sum()} missing or infinite value(s) '
+                         f'starting at position {np.argmax(not_finite)}')
+
+    # Offsets from the start of the year, in microseconds (the resolution of datetime.timedelta)
+    offsets = np.round((days - 1) * MICROSECONDS_PER_DAY).astype(np.int64)
+
+    # Round the seconds of the day to the nearest hour
+    seconds = offsets // 1_000_000 % SECONDS_PER_DAY
+    rounding = (seconds + 1800) // 3600 * 3600
+    offsets += (rounding - seconds) * 1_000_000
+
+    return pd.Timestamp(year, 1, 1) + pd.to_timedelta(offsets, unit='us')
 
 
 def convert_to_datetime(year: int, days: List[int]) -> List[datetime.datetime]:
@@ -1,11 +1,43 @@
 import os
+import codecs
+import gzip
+import hashlib
+import io
+from itertools import islice
 from typing import List
 from enum import Enum
+import numpy as np
 import pandas as pd
 import h5py
 import sqlite3
+import yaml
 from . import w2_datetime
 
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# Use the YAML loader of the LibYAML C library if PyYAML was built with it. Otherwise, use the pure Python loader.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Use the faster Rust-based calamine Excel reader if it is installed. Otherwise, pandas selects the engine.
+try:
+    import python_calamine
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Files larger than this (in bytes) are parsed by pandas in chunks of CSV_CHUNK_ROWS rows
+CSV_CHUNK_THRESHOLD = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 200_000
+
+# Number of bytes read from the start of a file to detect its encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Delimiters recognized in delimited (CSV) time series files
+DELIMITERS = [',', '\t', ';', '|']
+
 
 class FileType(Enum):
     """
@@ -20,6 +52,40 @@ class FileType(Enum):
     CSV = 2
 
 
+# File types of the time series file extensions
+FILE_EXTENSION_TYPES = {
+    '.csv': FileType.CSV,
+    '.npt': FileType.FIXED_WIDTH,
+    '.opt': FileType.FIXED_WIDTH
+}
+
+# Default data columns of meteorology files
+MET_DATA_COLUMNS = [
+    'Air Temperature ($^oC$)',
+    'Dew Point Temperature ($^oC$)',
+    'Wind Speed (m/s)',
+    'Wind Direction (radians)',
+    'Cloudiness (fraction)',
+    'Solar Radiation ($W/m^2$)'
+]
+
+
+def open_input_file(file_path: str, mode: str = 'rb'):
+    """
+    Open an input file, decompressing it on the fly if it is gzip-compressed (*.gz).
+
+    :param file_path: The path to the file.
+    :type file_path: str
+    :param mode: The file mode, 'rb' or 'rt'. Defaults to 'rb'.
+    :type mode: str
+    :return: The open file object.
+    """
+
+    if file_path.lower().endswith('.gz'):
+        return gzip.open(file_path, mode)
+    return open(file_path, mode)
+
+
 def get_header_row_number(file_path):
     """Get the row number of the header in a file.
 
@@ -56,10 +122,10 @@ def get_data_columns_csv(file_path):
         FileNotFoundError: If the specified file does not exist.
     """
 
-    with open(file_path, 'r') as f:
-        # Get the header line
-        lines = f.readlines()
+    with open_input_file(file_path, 'rt') as f:
+        # Get the header line. Only the lines up to the header are read, not the whole file.
         header_row_number = get_header_row_number(file_path)
+        lines = list(islice(f, header_row_number + 1))
         header_vals = lines[header_row_number].strip().strip(',').strip().split(',')
         # Get the data columns
         for i, val in enumerate(header_vals):
@@ -85,10 +151,10 @@ def get_data_columns_fixed_width(file_path):
         ['Column1', 'Column2', 'Column3', 'Column4']
     """
 
-    with open(file_path, 'r') as f:
-        # Get the header line
+    with open_input_file(file_path, 'rt') as f:
+        # Get the header line. Only the lines up to the header are read, not the whole file.
         header_row_number = get_header_row_number(file_path)
-        header = f.readlines()[header_row_number]
+        header = list(islice(f, header_row_number + 1))[header_row_number]
         header_vals = split_fixed_width_line(header, 8)
 
         for i, val in enumerate(header_vals):
@@ -121,6 +187,94 @@ def split_fixed_width_line(line, field_width):
     return [line[i:i + field_width] for i in range(0, len(line), field_width)]
 
 
+def parse_fixed_width_numbers(data: bytes, skiprows: int, ncols: int, field_width: int = 8) -> List[np.ndarray]:
+    """
+    Parse the numbers in a fixed-width file with vectorized NumPy operations.
+
+    The data lines are packed into a fixed-length byte string array, which is split into fields by
+    viewing it as an array of field_width-byte strings. Each column of fields is then converted in one
+    call. The result follows pd.read_fwf: blank lines are skipped, blank fields are parsed as NaN,
+    characters past the last field are ignored, and a column is read as int64 if every field in it is
+    an integer, otherwise as float64.
+
+    :param data: The contents of the file.
+    :type data: bytes
+    :param skiprows: The number of header rows to skip.
+    :type skiprows: int
+    :param ncols: The number of fields to read from each line.
+    :type ncols: int
+    :param field_width: The width of each field. Defaults to 8.
+    :type field_width: int, optional
+    :raises ValueError: If any of the fields is not a number.
+    :return: One array per field, in the order of the fields in each line.
+    :rtype: List[np.ndarray]
+    """
+
+    lines = [line for line in data.splitlines()[skiprows:] if line.strip()]
+    fields = np.array(lines, dtype=f'S{ncols * field_width}').view(f'S{field_width}').reshape(len(lines), ncols)
+    fields = np.char.strip(fields)
+
+    # Integer fields are digits with an optional sign. The length limit keeps the values within int64.
+    digits = np.char.lstrip(fields, b'+-')
+    is_integer = np.char.isdigit(digits) & (np.char.str_len(digits) < 19)
+
+    columns = []
+    for i in range(ncols):
+        if len(lines) and is_integer[:, i].all():
+            columns.append(fields[:, i].astype(np.int64))
+        else:
+            column = fields[:, i].copy()
+            column[column == b''] = b'nan'
+            columns.append(column.astype(np.float64))
+    return columns
+
+
+def detect_delimiter(line: bytes):
+    """
+    Detect the delimiter used in a line of a delimited file.
+
+    :param line: A data line from the file, as bytes.
+    :type line: bytes
+    :return: The most frequent delimiter in the line, or None if the line contains no delimiters
+             (e.g., a fixed-width line).
+    :rtype: str or None
+    """
+
+    counts = {delimiter: line.count(delimiter.encode('ascii')) for delimiter in DELIMITERS}
+    delimiter = max(counts, key=counts.get)
+    if counts[delimiter] == 0:
+        return None
+    return delimiter
+
+
+def detect_encoding(infile: str) -> str:
+    """
+    Detect the text encoding of a CE-QUAL-W2 input file.
+
+    The data in these files are ASCII, but the header lines sometimes contain non-ASCII characters
+    such as a Latin-1 degree sign. A sample of the file is checked for non-ASCII bytes in one pass.
+    If there are any, the sample is validated as UTF-8 and Latin-1 is used if it is not valid UTF-8.
+
+    :param infile: The path to the input file.
+    :type infile: str
+    :return: The name of the encoding ('utf-8' or 'latin-1').
+    :rtype: str
+    """
+
+    with open_input_file(infile) as f:
+        sample = f.read(ENCODING_SAMPLE_SIZE)
+
+    if sample.isascii():
+        return 'utf-8'
+
+    try:
+        # A multi-byte character may be cut off at the end of the sample, so the decode is not final
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
 def dataframe_to_date_format(year: int, data_frame: pd.DataFrame) -> pd.DataFrame:
     """
     Convert the day-of-year column in a CE-QUAL-W2 data frame to datetime objects.
@@ -154,35 +308,50 @@ def read_npt_opt(infile: str, data_columns: List[str], skiprows: int = 3) -> pd.
     """
 
     # This function cannot trust that the file is actually in fixed-width format.
-    # Check if the first line after the header contains commas.
-    # If it is a CSV file, then call read_csv() instead.
-
-    # TODO: Add support for tabs and other delimiters. (LOW PRIORITY)
+    # Check if the first line after the header contains commas, tabs, or other delimiters.
+    # If it is a delimited file, then call read_csv() instead.
 
-    with open(infile, 'r', encoding='utf-8') as f:
+    # The line is read as bytes, since the delimiters are ASCII and the header lines may use any
+    # encoding (e.g., a Latin-1 degree sign), so nothing needs to be decoded.
+    with open_input_file(infile) as f:
         for _ in range(skiprows + 1):
             line = f.readline()
-        if ',' in line:
-            return read_csv(infile, data_columns=data_columns, skiprows=skiprows)
+    delimiter = detect_delimiter(line)
+    if delimiter is not None:
+        return read_csv(infile, data_columns=data_columns, skiprows=skiprows, delimiter=delimiter)
 
     # Parse the fixed-width file
 
     # Number of columns to read, including the date/day column
     ncols_to_read = len(data_columns) + 1
 
-    columns_to_read = ['DoY', *data_columns]
+    with open_input_file(infile) as f:
+        data = f.read()
+
+    # Parse the numbers with NumPy, which is much faster than the Python parser used by
+    # pd.read_fwf. If any of the fields is not a number, or a day is missing, parse the file
+    # with pd.read_fwf instead.
     try:
-        df = pd.read_fwf(infile, skiprows=skiprows, widths=ncols_to_read*[8],
-                         names=columns_to_read, index_col=0)
-    except:
-        raise IOError(f'Error reading {infile}')
+        day, *values = parse_fixed_width_numbers(data, skiprows, ncols_to_read)
+        if np.isnan(day).any():
+            raise ValueError('Missing day in the first column')
+        df = pd.DataFrame(dict(enumerate(values)), index=pd.Index(day, name='DoY'))
+        df.columns = data_columns
+    except ValueError:
+        encoding = detect_encoding(infile)
+        columns_to_read = ['DoY', *data_columns]
+        try:
+            df = pd.read_fwf(io.BytesIO(data), skiprows=skiprows, widths=ncols_to_read*[8],
+                             names=columns_to_read, index_col=0, encoding=encoding)
+        except:
+            raise IOError(f'Error reading {infile}')
 
     df.attrs['Filename'] = infile
 
     return df
 
 
-def read_csv(infile: str, data_columns: List[str], skiprows: int = 3) -> pd.DataFrame:
+def read_csv(infile: str, data_columns: List[str], skiprows: int = 3, delimiter: str = ',') -> pd.DataFrame:
     """
     Read CE-QUAL-W2 time series in CSV format.
 
@@ -192,31 +361,110 @@ def read_csv(infile: str, data_columns: List[str], skiprows: int = 3) -> pd.Data
     :type data_columns: List[str]
     :param skiprows: The number of header rows to skip. Defaults to 3.
     :type skiprows: int, optional
+    :param delimiter: The field delimiter. Defaults to ','.
+    :type delimiter: str, optional
     :return: A DataFrame of the time series data read from the input file.
     :rtype: pd.DataFrame
     """
 
-    try:
-        df = pd.read_csv(infile, skiprows=skiprows, names=data_columns, index_col=0)
-    except IndexError:
-        # Handle trailing comma, which adds an extra (empty) column
+    encoding = detect_encoding(infile)
+
+    # Use the multi-threaded PyArrow CSV parser if it is installed. Fall back to the pandas
+    # parser if PyArrow is not available or cannot parse the file.
+    if pacsv is not None:
         try:
-            df = pd.read_csv(infile, skiprows=skiprows, names=[*data_columns, 'JUNK'], index_col=0)
-            df = df.drop(axis=1, labels='JUNK')
-        except IndexError:
-            print('Error reading ' + infile)
-            print('Trying again with an additional column')
-            df = pd.read_csv(infile, skiprows=skiprows, names=[*data_columns, 'JUNK1', 'JUNK2'],
-                             index_col=0)
-            df = df.drop(axis=1, labels=['JUNK1', 'JUNK2'])
-    except:
+            df = read_csv_pyarrow(infile, data_columns, skiprows=skiprows, encoding=encoding, delimiter=delimiter)
+            df.attrs['Filename'] = infile
+            return df
+        except (ValueError, OSError):
+            pass
+
+    # Read the file in one pass. Only the day column and the data columns are parsed, so the empty
+    # columns created by trailing commas are skipped without having to retry the read.
+    ncols = len(data_columns) + 1
+    try:
+        df = read_csv_chunked(infile, skiprows=skiprows, names=['DoY', *data_columns], usecols=range(ncols),
+                              index_col=0, encoding=encoding, sep=delimiter)
+    except Exception:
         raise IOError(f'Error reading {infile}')
+    df.index.name = None
 
     df.attrs['Filename'] = infile
 
     return df
 
 
+def read_csv_chunked(infile: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file with pandas, parsing large files in chunks.
+
+    Files larger than CSV_CHUNK_THRESHOLD bytes are read CSV_CHUNK_ROWS rows at a time and the chunks
+    are concatenated, which bounds the memory used by the parser. Smaller files are read in one call.
+
+    :param infile: The path to the CSV file.
+    :type infile: str
+    :param kwargs: Keyword arguments passed to pd.read_csv().
+    :return: A DataFrame of the data read from the input file.
+    :rtype: pd.DataFrame
+    """
+
+    if os.path.getsize(infile) <= CSV_CHUNK_THRESHOLD:
+        return pd.read_csv(infile, **kwargs)
+
+    with pd.read_csv(infile, chunksize=CSV_CHUNK_ROWS, **kwargs) as reader:
+        return pd.concat(reader)
+
+
+def read_csv_pyarrow(infile: str, data_columns: List[str], skiprows: int = 3, encoding: str = 'utf-8',
+                     delimiter: str = ',') -> pd.DataFrame:
+    """
+    Read CE-QUAL-W2 time series in CSV format using the PyArrow CSV parser.
+
+    The first column is used as the index. Empty trailing columns, which are created by trailing
+    commas, are dropped.
+
+    :param infile: The path to the time series file (*.npt or *.opt).
+    :type infile: str
+    :param data_columns: The names of the data columns.
+    :type data_columns: List[str]
+    :param skiprows: The number of header rows to skip. Defaults to 3.
+    :type skiprows: int, optional
+    :param encoding: The text encoding of the file. Defaults to 'utf-8'.
+    :type encoding: str, optional
+    :param delimiter: The field delimiter. Defaults to ','.
+    :type delimiter: str, optional
+    :raises ValueError: If the column names are duplicated, or the file cannot be parsed or has a different
+                        number of columns than expected.
+    :return: A DataFrame of the time series data read from the input file.
+    :rtype: pd.DataFrame
+    """
+
+    # Reject duplicate column names, as the pandas parser does, so that a file is read (or not) the same way
+    # whether or not PyArrow is installed
+    names = ['DoY', *data_columns]
+    if len(set(names)) != len(names):
+        raise ValueError('Duplicate names are not allowed.')
+
+    read_options = pacsv.ReadOptions(skip_rows=skiprows, autogenerate_column_names=True, block_size=8 << 20,
+                                     encoding=encoding)
+    parse_options = pacsv.ParseOptions(delimiter=delimiter)
+    table = pacsv.read_csv(infile, read_options=read_options, parse_options=parse_options)
+
+    ncols = len(data_columns) + 1
+    if table.num_columns < ncols:
+        raise ValueError(f'Expected {ncols} columns in {infile}, found {table.num_columns}')
+    for column in table.columns[ncols:]:
+        if column.null_count != len(column):
+            raise ValueError(f'Expected {ncols} columns in {infile}, found {table.num_columns}')
+
+    # Convert the data columns and the index column separately. Setting the index of the converted
+    # table with set_index would copy all the data columns a second time.
+    df = table.select(range(1, ncols)).rename_columns(data_columns).to_pandas()
+    df.index = pd.Index(table.column(0).to_numpy())
+
+    return df
+
+
 def read_sqlite(file_path: str) -> pd.DataFrame:
     """
     Read an SQLite database file and return the contents of the first table as a Pandas DataFrame.
@@ -258,11 +506,8 @@ def read_sqlite(file_path: str) -> pd.DataFrame:
     # Create a Pandas DataFrame from the records and column names
     df = pd.DataFrame(records, columns=column_names)
 
-    # Convert the first column to Pandas date-time objects
-    df[column_names[0]] = pd.to_datetime(df[column_names[0]])
-    
-    # Set the index to the date-time column
-    df.set_index(column_names[0], inplace=True)
+    # Convert the first column to Pandas date-time objects and move it to the index
+    df.index = pd.to_datetime(df.pop(column_names[0]))
 
     # Close the cursor and connection
     cursor.close()
@@ -280,7 +525,8 @@ def read(*args, **kwargs):
     This function supports reading data from CSV (Comma Separated Values) files and fixed-width
     format (npt/opt) files.  The file type can be explicitly specified using the `file_type`
     keyword argument, or it can be inferred from the file extension. By default, the function
-    assumes a skiprows value of 3 for header rows.
+    assumes a skiprows value of 3 for header rows. Gzip-compressed files (e.g., *.npt.gz) are
+    decompressed while they are read.
 
     :param args: Any number of positional arguments. The first argument should be the path to the
                  input time series file. The second argument should be the start year of the
@@ -290,6 +536,12 @@ def read(*args, **kwargs):
                    - skiprows: The number of header rows to skip. Defaults to 3.
                    - file_type: The file type (CSV, npt, or opt). If not specified, it is
                                 determined from the file extension.
+                   - downcast: If True, downcast floating point columns to float32 where possible
+                               and convert low-cardinality text columns to categoricals, which
+                               halves the memory used by the data. Defaults to False.
+                   - cache: If True, save the data to a Parquet side-car file next to the input
+                            file and read it from there on later calls, as long as the input file
+                            has not changed. Requires PyArrow. Defaults to False.
     :raises ValueError: If the file type was not specified and could not be determined from the
                         filename.
     :raises ValueError: If an unrecognized file type is encountered. Valid file types are CSV, npt,
@@ -308,19 +560,30 @@ def read(*args, **kwargs):
     # Assign keywords to variables
     skiprows = kwargs.get('skiprows', 3)
     file_type = kwargs.get('file_type', None)
+    downcast = kwargs.get('downcast', False)
 
     # If not defined, set the file type using the input filename
     if not file_type:
-        if infile.lower().endswith('.csv'):
-            file_type = FileType.CSV
-        elif infile.lower().endswith('.npt') or infile.lower().endswith('.opt'):
-            file_type = FileType.FIXED_WIDTH
-        else:
+        name = infile.lower()
+        if name.endswith('.gz'):
+            name = name[:-3]
+        extension = os.path.splitext(name)[1]
+        file_type = FILE_EXTENSION_TYPES.get(extension)
+        if file_type is None:
             raise ValueError(
                 'The file type was not specified, and it could not be determined from the filename.')
 
     print('file_type:', file_type)
 
+    # Read from the Parquet side-car file, if requested and it is up to date
+    cache = kwargs.get('cache', False) and pacsv is not None
+    if cache:
+        cache_path = get_cache_path(infile, year, data_columns, skiprows, file_type, downcast)
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(infile):
+            df = pd.read_parquet(cache_path)
+            df.attrs['Filename'] = infile
+            return df
+
     # Read the data
     if file_type == FileType.FIXED_WIDTH:
         df = read_npt_opt(infile, data_columns, skiprows=skiprows)
@@ -333,9 +596,60 @@ def read(*args, **kwargs):
     df = dataframe_to_date_format(year, df)
     df.attrs['Filename'] = infile
 
+    if downcast:
+        df = downcast_columns(df)
+
+    # Save the Parquet side-car file. The cache is optional, so failures to write it are ignored.
+    if cache:
+        try:
+            df.to_parquet(cache_path, compression='zstd')
+        except (OSError, ValueError) as e:
+            print(f'Could not write the cache file {cache_path}: {e}')
+
     return df
 
 
+def downcast_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce the memory used by a dataframe by downcasting its columns.
+
+    Floating point columns are downcast to the smallest float type (float32) with pd.to_numeric. Text
+    columns in which fewer than half of the values are unique are converted to categoricals.
+
+    :param df: The DataFrame to downcast. It is modified in place.
+    :type df: pd.DataFrame
+    :return: The downcast DataFrame.
+    :rtype: pd.DataFrame
+    """
+
+    for column, series in df.items():
+        if pd.api.types.is_float_dtype(series):
+            df[column] = pd.to_numeric(series, downcast='float')
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if series.nunique() < 0.5 * len(series):
+                df[column] = series.astype('category')
+
+    return df
+
+
+def get_cache_path(infile: str, *read_options) -> str:
+    """
+    Get the path of the Parquet side-car cache file of an input file.
+
+    The cache file is stored next to the input file. Its name includes a hash of the options used to
+    read the file, so that reading the same file with different options uses a different cache file.
+
+    :param infile: The path to the input time series file.
+    :type infile: str
+    :param read_options: The options used to read the file (e.g., year, data columns, skiprows).
+    :return: The path to the cache file.
+    :rtype: str
+    """
+
+    options_hash = hashlib.md5(repr(read_options).encode('utf-8')).hexdigest()[:12]
+    return f'{infile}.{options_hash}.parquet'
+
+
 def read_met(*args, **kwargs) -> pd.DataFrame:
     """
     Read meteorology time series.
@@ -358,14 +672,7 @@ def read_met(*args, **kwargs) -> pd.DataFrame:
     infile, year = args
 
     if not kwargs.get('data_columns'):
-        kwargs['data_columns'] = [
-            'Air Temperature ($^oC$)',
-            'Dew Point Temperature ($^oC$)',
-            'Wind Speed (m/s)',
-            'Wind Direction (radians)',
-            'Cloudiness (fraction)',
-            'Solar Radiation ($W/m^2$)'
-        ]
+        kwargs['data_columns'] = list(MET_DATA_COLUMNS)
     data_columns = kwargs.get('data_columns')
 
     return read(infile, year, data_columns, **kwargs)
@@ -383,20 +690,20 @@ def read_excel(file_path: str, **kwargs):
     # Get keyword arguments
     skiprows = kwargs.get('skiprows', 3)
 
-    df = pd.read_excel(file_path, skiprows=skiprows)
-    first_column_name = df.columns[0]
-    df.rename(columns={f'{first_column_name}': 'Date'}, inplace=True)
-    df['Date'] = pd.to_datetime(df['Date'], format='%m/%d/%Y %H:%M')
-    df.set_index('Date', inplace=True)
+    df = pd.read_excel(file_path, skiprows=skiprows, engine=EXCEL_ENGINE)
+
+    # Move the first column to the index directly, without renaming it or rebuilding the data frame
+    dates = df.pop(df.columns[0])
+    df.index = pd.to_datetime(dates, format='%m/%d/%Y %H:%M').rename('Date')
     return df
 
 
-def write_hdf(df: pd.DataFrame, group: str, outfile: str, overwrite=True):
+def write_hdf(df: pd.DataFrame, group: str, outfile: str, overwrite=True, compression='gzip', compression_level=4):
     """
     Write CE-QUAL-W2 timeseries dataframe to HDF5
 
     The index column must be a datetime array.
-    This column will be written to HDF5 as a string array.
+    This column will be written to HDF5 as a fixed-length string array.
     Each data column will be written using its data type.
 
     :param df: The DataFrame containing the timeseries data.
@@ -407,21 +714,32 @@ def write_hdf(df: pd.DataFrame, group: str, outfile: str, overwrite=True):
     :type outfile: str
     :param overwrite: Whether to overwrite existing data in HDF5. Defaults to True.
     :type overwrite: bool, optional
+    :param compression: HDF5 compression filter applied to each dataset ('gzip', 'lzf', or None). Defaults to 'gzip'.
+    :type compression: str, optional
+    :param compression_level: Compression level for the gzip filter (0-9). Defaults to 4.
+    :type compression_level: int, optional
     """
 
+    compression_opts = compression_level if compression == 'gzip' else None
+
+    # Format the dates in one vectorized call, as fixed-length ASCII strings (e.g., 2020-01-01 00:00:00).
+    # Fractional seconds are only written if any of the dates have them.
+    dates = df.index.values.astype('datetime64[us]')
+    unit = 'us' if (dates.astype(np.int64) % 1_000_000).any() else 's'
+    index = np.char.replace(np.datetime_as_string(dates, unit=unit), 'T', ' ').astype(np.bytes_)
+
     with h5py.File(outfile, 'a') as f:
-        index = df.index.astype('str')
-        string_dt = h5py.special_dtype(vlen=str)
         date_path = f'{group}/{df.index.name}'
         if overwrite and (date_path in f):
             del f[date_path]
-        f.create_dataset(date_path, data=index, dtype=string_dt)
+        f.create_dataset(date_path, data=index, compression=compression, compression_opts=compression_opts)
 
-        for col in df.columns:
+        for col, series in df.items():
             ts_path = f'{group}/{col}'
             if overwrite and (ts_path in f):
                 del f[ts_path]
-            f.create_dataset(ts_path, data=df[col])
+            f.create_dataset(ts_path, data=series.to_numpy(), compression=compression,
+                             compression_opts=compression_opts)
 
 
 def read_hdf(group: str, infile: str, variables: List[str]) -> pd.DataFrame:
@@ -439,26 +757,28 @@ def read_hdf(group: str, infile: str, variables: List[str]) -> pd.DataFrame:
     :param variables: A list of variable names to read from the HDF5 file.
     :type variables: List[str]
 
+    :raises KeyError: If any of the variables are not in the group.
     :return: Dataframe containing the time series data.
     :rtype: pd.DataFrame
     """
 
     with h5py.File(infile, 'r') as f:
-        # Read dates
-        date_path = f'{group}/Date'
-        dates_str = f.get(date_path)
-
-        # Read time series data
-        ts = {}
-        for variable in variables:
-            ts_path = f'{group}/{variable}'
-            ts[variable] = f.get(ts_path)
-
-        dates = []
-        for dstr in dates_str:
-            dstr = dstr.decode('utf-8')
-            dt = pd.to_datetime(dstr)
-            dates.append(dt)
+        # Look up the group once. The datasets are then found relative to it, instead of resolving
+        # the full path of each dataset from the root of the file.
+        h5_group = f[group]
+
+        # Check all the variables up front, so that no data are read if any of them are missing
+        missing = [variable for variable in variables if variable not in h5_group]
+        if missing:
+            raise KeyError(f'Variables not found in {infile}/{group}: {", ".join(missing)}')
+
+        # Read dates. The whole array is read and decoded at once and parsed in a single vectorized call.
+        dates_str = np.char.decode(h5_group['Date'][()].astype(np.bytes_), 'utf-8')
+        dates = pd.to_datetime(dates_str)
+
+        # Read time series data. Each dataset is read into a NumPy array in one call, instead of
+        # handing the HDF5 dataset to pandas to be read element by element.
+        ts = {variable: h5_group[variable][()] for variable in variables}
 
         df = pd.DataFrame(ts, index=dates)
         df.attrs['Filename'] = infile
@@ -480,7 +800,7 @@ def read_plot_control(yaml_infile: str, index_name: str = 'item') -> pd.DataFram
     :rtype: pd.DataFrame
     """
     with open(yaml_infile, encoding='utf-8') as yaml_file:
-        yaml_contents = yaml.load(yaml_file, Loader=yaml.SafeLoader)
+        yaml_contents = yaml.load(yaml_file, Loader=YAML_LOADER)
         control_df = pd.json_normalize(yaml_contents)
         control_df.set_index(control_df[index_name], inplace=True)
         control_df.drop(columns=[index_name], inplace=True)
@@ -1,7 +1,10 @@
 import os
+import gzip
 import pandas as pd
 import datetime
 import sqlite3
+from contextlib import closing
+from typing import Union
 
 
 def generate_plots_report(*args, **kwargs) -> None:
@@ -89,32 +92,36 @@ def generate_plots_report(*args, **kwargs) -> None:
             '--top-level-division="chapter"')
 
 
-def sql_query(database_name: str, query: str):
+def sql_query(database_name: Union[str, sqlite3.Connection], query: str):
     """
     Read time series data from a SQLite database using an SQL query.
 
-    :param database_name: The name of the SQLite database file.
-    :type database_name: str
+    The database can be given as an open connection, so that several queries share one connection
+    instead of opening and closing the database for each query.
+
+    :param database_name: The name of the SQLite database file, or an open connection to it.
+    :type database_name: str or sqlite3.Connection
     :param query: The SQL query to execute for retrieving the data.
     :type query: str
     :return: A Pandas DataFrame containing the queried time series data.
     :rtype: pandas.DataFrame
     """
 
-    with sqlite3.connect(database_name) as db:
-        df = pd.read_sql(query, db)
-        df.index = df['Date']
-        df.index = pd.to_datetime(df.index)
-        df.drop(columns=['Date'], inplace=True)
-        return df
+    if isinstance(database_name, sqlite3.Connection):
+        df = pd.read_sql(query, database_name)
+    else:
+        with closing(sqlite3.connect(database_name)) as db:
+            df = pd.read_sql(query, db)
+    df.index = pd.to_datetime(df.pop('Date'))
+    return df
 
 
-def read_sql(database: str, table: str, index_is_datetime=True):
+def read_sql(database: Union[str, sqlite3.Connection], table: str, index_is_datetime=True):
     """
     Read data from a SQLite database using an SQL query.
 
-    :param database: The name of the SQLite database.
-    :type database: str
+    :param database: The name of the SQLite database, or an open connection to it.
+    :type database: str or sqlite3.Connection
     :param table: The name of the table from which to retrieve the data.
     :type table: str
     :param index_is_datetime: Flag indicating whether to convert the index to datetime.
@@ -124,9 +131,11 @@ def read_sql(database: str, table: str, index_is_datetime=True):
     :rtype: pandas.DataFrame
     """
 
-    connection = sqlite3.connect(database)
-    df = pd.read_sql_query(f'select * from {table}', connection)
-    connection.close()
+    if isinstance(database, sqlite3.Connection):
+        df = pd.read_sql_query(f'select * from {table}', database)
+    else:
+        with closing(sqlite3.connect(database)) as connection:
+            df = pd.read_sql_query(f'select * from {table}', connection)
     df.index = pd.to_datetime(df.index)
     return df
 
@@ -135,6 +144,9 @@ def write_csv(df: pd.DataFrame, outfile: str, year: int, header: str = None, flo
     """
     Write a Pandas DataFrame to a CSV file with additional formatting options.
 
+    If the output filename ends with .gz, the file is gzip-compressed. Time series of numbers
+    written as text compress well, typically to a fraction of their size.
+
     :param df: The DataFrame to be written to the CSV file.
     :type df: pandas.DataFrame
     :param outfile: The path to the output CSV file.
@@ -152,12 +164,18 @@ def write_csv(df: pd.DataFrame, outfile: str, year: int, header: str = None, flo
     # Convert date to Julian days (day of year)
     diff = df.index - datetime.datetime(year, 1, 1) + datetime.timedelta(days=1)
     jday = diff.days + diff.seconds / 3600.0 / 24.0
-    columns = ['JDAY'] + df.columns.to_list()  # This needs to be done before assigning jday
-    df['JDAY'] = jday
-    df = df[columns]
+
+    # Write the JDAY column first. A shallow copy is made so that the column is not added to the
+    # caller's data frame, and the data columns are not copied.
+    df = df.copy(deep=False)
+    df.insert(0, 'JDAY', jday)
 
     if not header:
         header = '$\n\n'
-    with open(outfile, 'w', encoding="utf-8") as f:
+    if outfile.lower().endswith('.gz'):
+        f = gzip.open(outfile, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        f = open(outfile, 'w', encoding="utf-8")
+    with f:
         f.write(header)
         df.to_csv(f, header=True, index=False, float_format=float_format)
\ No newline at end of file
@@ -1 +1,51 @@
+import warnings
+import numpy as np
+import pandas as pd
 from . import w2_io
+
+
+SUMMARY_STATISTICS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+def summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute summary statistics of the numeric columns of a dataframe.
+
+    The statistics are the same as those returned by pd.DataFrame.describe(): count, mean, standard deviation,
+    minimum, 25th, 50th, and 75th percentiles, and maximum. Missing values are ignored. The statistics are
+    computed with NumPy reductions over the whole 2D array instead of column by column. A frame with no rows gives
+    a count of zero and NaN for the other statistics, and a frame with no numeric columns gives an empty table.
+
+    :param df: The DataFrame containing the time series data.
+    :type df: pd.DataFrame
+
+    :return: Dataframe of summary statistics, with one row per statistic and one column per numeric data column.
+    :rtype: pd.DataFrame
+    """
+
+    numeric_df = df.select_dtypes(include='number')
+    arr = numeric_df.to_numpy(dtype=float)
+
+    # Compute the missing-value mask once and reuse it for the count, mean, and standard deviation
+    valid = ~np.isnan(arr)
+    count = valid.sum(axis=0)
+
+    # All-NaN columns produce NaN statistics, as they do in describe()
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        mean = np.where(valid, arr, 0.0).sum(axis=0) / count
+        deviations = np.where(valid, arr - mean, 0.0)
+        std = np.sqrt((deviations ** 2).sum(axis=0) / (count - 1))
+        std[count < 2] = np.nan
+
+        # The minimum, quartiles, and maximum are computed together, from a single partition of each column.
+        # A frame with no rows or no numeric columns has nothing to partition, so its order statistics are NaN.
+        if arr.size:
+            percentiles = np.nanpercentile(arr, [0, 25, 50, 75, 100], axis=0)
+        else:
+            percentiles = np.full((5, arr.shape[1]), np.nan)
+        minimum, *quartiles, maximum = percentiles
+
+    stats = np.vstack([count, mean, std, minimum, *quartiles, maximum])
+
+    return pd.DataFrame(stats, index=SUMMARY_STATISTICS, columns=numeric_df.columns)
@@ -1,5 +1,6 @@
 import warnings
 import os
+import numpy as np
 import pandas as pd
 import seaborn as sns
 from matplotlib import pyplot as plt
@@ -7,8 +8,14 @@ import matplotlib as mpl
 import yaml
 from typing import List
 from collections import OrderedDict
-import holoviews as hv
-from bokeh.models import HoverTool, DatetimeTickFormatter
+from itertools import cycle, islice
+from concurrent.futures import ThreadPoolExecutor
+
+# Compile the LTTB bucket loop with Numba if it is installed. Otherwise, it runs in Python.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 warnings.filterwarnings("ignore")
 
 plt.style.use('seaborn')
@@ -121,6 +128,8 @@ def plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
         fig_size (tuple): The size of the figure in inches (width, height). Default is (15, 9).
         style (str): The line style of the plot. Default is '-'.
         colors: The colors to use for plotting.
+        max_points (int): If given, each column is downsampled with LTTB to about this many points before plotting,
+            e.g., twice the width of the plot in pixels. By default, all the points are plotted.
 
     Returns:
         plt.Figure: The figure object containing the plot.
@@ -136,6 +145,7 @@ def plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
     style: str = kwargs.get('style', '-')
     colors = kwargs.get('colors', k2)
     ylabel = kwargs.get('ylabel', None)
+    max_points = kwargs.pop('max_points', None)
 
     # Create the figure and axes
     if fig is None and ax is None:
@@ -156,7 +166,7 @@ def plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
         kwargs.pop('colors')
 
     # Create the plot
-    axes = df.plot(**kwargs)
+    axes = lttb_downsample(df, max_points).plot(**kwargs)
 
     # Get a list of line objects
     lines = ax.get_lines()
@@ -201,6 +211,8 @@ def multi_plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
         colors (Union[str, List[str]], optional): The colors to use for plotting. If not provided, a color palette will be used.
         style (str, optional): The line style of the plot. Default is '-'.
         palette (str, optional): The color palette to use. Default is 'colorblind'.
+        max_points (int, optional): If given, each column is downsampled with LTTB to about this many points before
+            plotting, e.g., twice the width of the plot in pixels. By default, all the points are plotted.
 
     Returns:
         plt.Figure: The figure object containing the subplots.
@@ -230,6 +242,7 @@ def multi_plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
     colors = kwargs.get('colors', None)
     style = kwargs.get('style', '-')
     palette = kwargs.get('palette', 'colorblind')
+    max_points = kwargs.get('max_points', None)
 
     if fig is None and ax is None:
         fig, ax = plt.subplots(figsize=figsize)
@@ -262,7 +275,7 @@ def multi_plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
     pandas_kwargs['legend'] = False
 
     # Create the plot
-    axes = df.plot(**pandas_kwargs)
+    axes = lttb_downsample(df, max_points).plot(**pandas_kwargs)
 
     # Set the title
     if title:
@@ -342,11 +355,46 @@ def multi_plot(df: pd.DataFrame, **kwargs) -> plt.Figure:
 #     return myplot
 
 
+def is_up_to_date(outpaths: List[str], inpaths: List[str]) -> bool:
+    """
+    Check whether all the output files exist and are at least as new as all the input files.
+
+    :param outpaths: Paths of the output files.
+    :type outpaths: List[str]
+    :param inpaths: Paths of the input files that the output files are made from.
+    :type inpaths: List[str]
+    :return: True if the output files do not need to be made again.
+    :rtype: bool
+    """
+    try:
+        return min(os.path.getmtime(path) for path in outpaths) >= \
+            max(os.path.getmtime(path) for path in inpaths)
+    except (OSError, ValueError):
+        return False
+
+
+def save_figure(fig: plt.Figure, outpaths: List[str]):
+    """
+    Save a figure to one or more image files.
+
+    :param fig: The figure to save.
+    :type fig: plt.Figure
+    :param outpaths: Paths of the image files. The format of each file is given by its extension.
+    :type outpaths: List[str]
+    """
+    for outpath in outpaths:
+        fig.savefig(outpath)
+
 def plot_all_files(plot_control_yaml: str, model_path: str, year: int, filetype: str = 'png',
-                   VERBOSE: bool = False):
+                   VERBOSE: bool = False, force: bool = False, max_workers: int = 4):
     """
     Plot all files specified in the plot control YAML file.
 
+    Files whose image files are newer than both the data file and the plot control file are
+    skipped without reading them, unless `force` is True. The files are read in parallel, and
+    the plots are made in order as the files become available. The image files are rendered and
+    written in the background while the next file is plotted.
+
     :param plot_control_yaml: Path to the plot control YAML file.
     :type plot_control_yaml: str
     :param model_path: Path to the model files directory.
@@ -357,13 +405,19 @@ def plot_all_files(plot_control_yaml: str, model_path: str, year: int, filetype:
     :type filetype: str
     :param VERBOSE: Flag indicating verbose output. Defaults to False.
     :type VERBOSE: bool
+    :param force: Flag indicating that all the plots are made, even if they are up to date.
+                  Defaults to False.
+    :type force: bool
+    :param max_workers: Maximum number of files read at the same time. Defaults to 4.
+    :type max_workers: int
     """
 
     # Read the plot control file
     control_df = read_plot_control(plot_control_yaml)
+    filetypes = filetype if isinstance(filetype, list) else [filetype]
 
-    # Iterate over the data frame, plot each file, and save
-    # an image file next to each data file in the model
+    # Iterate over the data frame and find the files to plot
+    jobs = []
     for row in control_df.iterrows():
         # Get the plotting parameters
         params = row[1]
@@ -372,49 +426,68 @@ def plot_all_files(plot_control_yaml: str, model_path: str, year: int, filetype:
         ylabels = params['Labels']
         plot_type = params['PlotType']
 
-        # Open and read file
+        # Skip the file without reading it if the plot type is not recognized
+        if plot_type not in ['combined', 'subplots', 'separate']:
+            print(f'Plot type not specified for {filename}')
+            continue
+
+        # Image files of each plot. Separate plots are saved to one file per column.
         inpath = os.path.join(model_path, filename)
-        if VERBOSE:
-            print(f'Reading {inpath}')
-        df = read(inpath, year, columns)
-
-        # Plot the data
-        plots = []
-        if plot_type == 'combined':
-            ts_plot = plot(df, y_label=ylabels[0], colors=k2)
-            ts_plot.plot_type = plot_type
-            plots.append(ts_plot)
-        elif plot_type == 'subplots':
-            # ts_plot = multi_plot(df, ylabels=ylabels, colors=k2)
-            ts_plot = multi_plot(df, ylabels=ylabels, palette='tab10')
-            ts_plot.plot_type = plot_type
-            plots.append(ts_plot)
-        elif plot_type == 'separate':
-            for i, col in enumerate(df.columns):
-                ts_plot = simple_plot(df[col], ylabel=ylabels[i], colors=k2)
+        if plot_type == 'separate':
+            outpaths = [[f'{inpath}_{col}.{ft}' for ft in filetypes] for col in columns]
+        else:
+            outpaths = [[f'{inpath}.{ft}' for ft in filetypes]]
+
+        # Skip the file without reading it if its plots are up to date
+        if not force and is_up_to_date([path for paths in outpaths for path in paths], [inpath, plot_control_yaml]):
+            if VERBOSE:
+                print(f'Plots of {inpath} are up to date')
+            continue
+
+        jobs.append((inpath, columns, ylabels, plot_type, outpaths))
+
+    # Read the files in parallel. Matplotlib is not thread-safe, so the files are plotted one at a
+    # time, in order, and an image file is saved next to each data file in the model. The figures
+    # are removed from pyplot before they are saved, so that they are not touched by the main thread
+    # while a single background thread renders and writes them.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, ThreadPoolExecutor(max_workers=1) as save_executor:
+        save_futures = []
+        futures = []
+        for inpath, columns, *_ in jobs:
+            if VERBOSE:
+                print(f'Reading {inpath}')
+            futures.append(executor.submit(read, inpath, year, columns))
+
+        for (inpath, columns, ylabels, plot_type, outpaths), future in zip(jobs, futures):
+            df = future.result()
+
+            # Plot the data
+            plots = []
+            if plot_type == 'combined':
+                ts_plot = plot(df, y_label=ylabels[0], colors=k2)
                 ts_plot.plot_type = plot_type
-                ts_plot.variable_name = col
                 plots.append(ts_plot)
-        else:
-            print(f'Plot type not specified for {filename}')
-
-        # Save the figure
-        for ts_plot in plots:
-            if isinstance(filetype, list):
-                for ft in filetype:
-                    if ts_plot.plot_type == 'separate':
-                        outpath = f'{inpath}_{ts_plot.variable_name}.{ft}'
-                        ts_plot.get_figure().savefig(outpath)
-                    else:
-                        outpath = f'{inpath}.{ft}'
-                        ts_plot.get_figure().savefig(outpath)
-            if isinstance(filetype, str):
-                if ts_plot.plot_type == 'separate':
-                    outpath = f'{inpath}_{ts_plot.variable_name}.{filetype}'
-                    ts_plot.get_figure().savefig(outpath)
-                else:
-                    outpath = f'{inpath}_{ts_plot.variable_name}.{filetype}'
-                    ts_plot.get_figure().savefig(outpath)
+            elif plot_type == 'subplots':
+                # ts_plot = multi_plot(df, ylabels=ylabels, colors=k2)
+                ts_plot = multi_plot(df, ylabels=ylabels, palette='tab10')
+                ts_plot.plot_type = plot_type
+                plots.append(ts_plot)
+            elif plot_type == 'separate':
+                for i, col in enumerate(df.columns):
+                    ts_plot = simple_plot(df[col], ylabel=ylabels[i], colors=k2)
+                    ts_plot.plot_type = plot_type
+                    ts_plot.variable_name = col
+                    plots.append(ts_plot)
+
+            # Save the figure
+            for ts_plot, paths in zip(plots, outpaths):
+                fig = ts_plot.get_figure()
+                plt.close(fig)
+                save_futures.append(save_executor.submit(save_figure, fig, paths))
+
+        # Raise any error that occurred while saving
+        for future in save_futures:
+            future.result()
 
                     
 @mpl.rc_context({'axes.labelsize': 3})
@@ -473,30 +546,49 @@ def hv_multi_plot(df: pd.DataFrame, **kwargs):
     Create a multi-plot using Holoviews.
 
     This function creates a multi-plot using the specified DataFrame and additional keyword arguments.
+
+    Each subplot is downsampled to at most about `max_points` points, which defaults to two points per
+    horizontal pixel. More points than that cannot be told apart on the screen, and capping them keeps
+    the plots responsive however long the time series are. Set `max_points` to None to plot all the points.
+    Time series longer than `webgl_threshold` points (default 2000) are rendered with WebGL.
     """
 
     import holoviews as hv
     import hvplot.pandas
     import panel as pn
     from holoviews import opts
-    hv.extension('bokeh')
+
+    # Load the Bokeh plotting extension only the first time it is needed
+    if 'bokeh' not in hv.Store.renderers:
+        hv.extension('bokeh')
 
     # Parse keyword arguments
     plot_width = kwargs.get('plot_width', 1400)
     plot_height = kwargs.get('plot_height', 600)
     line_color = kwargs.get('line_color', 'blue')
     line_width = kwargs.get('line_width', 1)
+    max_points = kwargs.get('max_points', 2 * plot_width)
+    webgl_threshold = kwargs.get('webgl_threshold', 2000)
 
-    # Convert the dataframe to a Holoviews Dataset
-    dataset = hv.Dataset(df, kdims=['Date'])
+    # Get the dates once. Each subplot is built from the dates and the NumPy array of its column,
+    # instead of selecting the column from a HoloViews Dataset of the whole data frame.
+    dates = df.index.to_numpy()
+
+    # The options and the rendering choices are the same for all the subplots, so set them up once
+    curve_opts = opts.Curve(width=plot_width, height=plot_height, line_color=line_color, line_width=line_width,
+        tools=['hover'])
+    use_webgl = len(df) > webgl_threshold
+    downsample = bool(max_points) and len(df) > max_points
 
     # Create a subplot for each column
     subplots = []
-    for column in df.columns:
-        subplot = dataset.to(hv.Curve, 'index', column).opts(xlabel='Date', ylabel=column).opts(
-            opts.Curve(width=plot_width, height=plot_height, line_color=line_color, line_width=line_width,
-                tools=['hover'])
-        )
+    for column, series in df.items():
+        subplot = hv.Curve((dates, series.to_numpy()), 'Date', column).opts(xlabel='Date', ylabel=column).opts(
+            curve_opts)
+        if use_webgl:
+            subplot = subplot.opts(hooks=[webgl_hook])
+        if downsample:
+            subplot = hv_downsample(subplot, max_points)
         subplots.append(subplot)
 
     # Combine all subplots into a single column layout
@@ -554,41 +646,198 @@ def hv_multi_plot(df: pd.DataFrame, **kwargs):
 
 def color_cycle(colors: List[str], num_colors: int):
     """Cycle through a list of colors"""
-    for i in range(num_colors):
-        yield colors[i % len(colors)]
+    return islice(cycle(colors), num_colors)
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the points of a time series to plot with the Largest-Triangle-Three-Buckets (LTTB) algorithm.
+
+    LTTB keeps the first and last points and divides the rest of the series into n_out - 2 buckets.
+    From each bucket it keeps the point that forms the largest triangle with the point kept from the
+    previous bucket and the average of the next bucket. This preserves the peaks and the visual
+    shape of the series with far fewer points.
+
+    Args:
+        x (np.ndarray): The x values (e.g., dates), in increasing order.
+        y (np.ndarray): The y values.
+        n_out (int): The number of points to keep.
+
+    Returns:
+        np.ndarray: The indices of the points to keep, in increasing order.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(np.float64, copy=False)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket edges for the points between the first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    return lttb_select(x, y, edges)
+
+def lttb_select(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Select one point from each LTTB bucket.
+
+    This is the loop over the buckets of lttb_indices. It is compiled with Numba, if Numba is installed.
+
+    Args:
+        x (np.ndarray): The x values, as float64.
+        y (np.ndarray): The y values, as float64.
+        edges (np.ndarray): The int64 indices of the bucket edges between the first and last points.
+
+    Returns:
+        np.ndarray: The indices of the points to keep, in increasing order.
+    """
+    n = len(x)
+    n_out = len(edges) + 1
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + np.argmax(areas)
+        indices[i + 1] = a
+
+    return indices
+
+if njit is not None:
+    lttb_select = njit(cache=True)(lttb_select)
+
+def lttb_downsample(df: pd.DataFrame, max_points: int) -> pd.DataFrame:
+    """
+    Downsample the columns of a time series DataFrame with LTTB for plotting.
+
+    The points of each numeric column are selected with lttb_indices, and the rows selected for any of
+    the columns are kept, so every column keeps its own peaks. Other columns (e.g., text) are not used to
+    select the points, but their values in the kept rows are returned with the rest of the data.
+
+    Args:
+        df (pd.DataFrame): The time series, indexed by date.
+        max_points (int): The approximate maximum number of points to keep per column.
+
+    Returns:
+        pd.DataFrame: The downsampled time series, or df itself if it has at most max_points rows.
+    """
+    if not max_points or len(df) <= max_points:
+        return df
+
+    # Convert the dates once, and all the numeric columns to one 2-D array, instead of converting the dates
+    # and allocating a new array for every column
+    x = df.index.to_numpy()
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(np.float64)
+    values = df.select_dtypes(include='number').to_numpy(dtype=float, na_value=np.nan)
+    if values.shape[1] == 0:
+        return df
+
+    keep = np.zeros(len(df), dtype=bool)
+    for column in range(values.shape[1]):
+        keep[lttb_indices(x, values[:, column], max_points)] = True
+    return df[keep]
+
+def hv_downsample(element, max_points: int):
+    """
+    Downsample a HoloViews element or DynamicMap to at most about max_points points with LTTB.
+
+    If HoloViews provides the downsample1d operation, the result is dynamic: the visible x range is
+    re-sampled whenever the plot is zoomed or panned. Otherwise, a fixed LTTB subset of the points is
+    plotted.
+
+    Args:
+        element (hv.Element or hv.DynamicMap): The element to downsample (e.g., a Curve).
+        max_points (int): The approximate maximum number of points to plot.
+
+    Returns:
+        hv.Element or hv.DynamicMap: The downsampled element.
+    """
+    import holoviews as hv
+
+    try:
+        from holoviews.operation.downsample import downsample1d
+        return downsample1d(element, algorithm='lttb', width=max_points)
+    except ImportError:
+        if isinstance(element, hv.DynamicMap):
+            return element.apply(hv_downsample, max_points=max_points)
+        keep = lttb_indices(element.dimension_values(0), element.dimension_values(1), max_points)
+        return element.iloc[keep]
+
+def webgl_hook(plot, element):
+    """Render a HoloViews Bokeh plot with WebGL instead of HTML canvas"""
+    plot.state.output_backend = 'webgl'
 
 def hv_plot(df: pd.DataFrame, width=1200, height=600, bgcolor='lightgray', line_color='blue',
-    fontsize={'xlabel': 11, 'ylabel': 11, 'xticks': 10, 'yticks': 10}):
+    fontsize={'xlabel': 11, 'ylabel': 11, 'xticks': 10, 'yticks': 10}, downcast=True, webgl_threshold=2000,
+    max_points=None):
+
+    # HoloViews and Bokeh are only needed for the interactive plots, so import them here instead of
+    # at module load, which keeps "import cequalw2" fast for scripts that only read or write files.
+    import holoviews as hv
+    from bokeh.models import HoverTool, DatetimeTickFormatter
+
+    # Plots do not need double precision. Downcasting float64 columns to float32 halves the
+    # size of the data that is serialized and sent to the browser.
+    if downcast:
+        float64_columns = df.select_dtypes(include='float64').columns
+        if len(float64_columns) > 0:
+            df = df.astype({column: 'float32' for column in float64_columns})
 
     # Create a HoloViews Curve element for each data column
     curves = OrderedDict()
     tooltips = OrderedDict()
 
-    # Specify format for the date axis
-
-    for column in df.columns:
+    # Extract the dates once and give each curve only its own pair of arrays, instead of a reference
+    # to the whole data frame that HoloViews would have to index for every curve
+    dates = df.index.to_numpy()
+
+    # Specify format for the date axis. The formatter is shared by all the curves.
+    date_axis_formatter = DatetimeTickFormatter(
+        minutes=["%H:%M"],
+        hours=["%H:%M"],
+        days=["%d %b %Y"],
+        months=["%d %b %Y"],
+        years=["%d %b %Y"]
+    )
+
+    # The options are the same for all the curves, so they are collected once and applied in one call per curve.
+    # They are applied as an hv.opts.Curve object, whose keywords are validated once when it is created, instead
+    # of validating the keywords again for every curve.
+    curve_options = dict(
+        width=width,
+        height=height,
+        # bgcolor='black',
+        line_color='dodgerblue',
+        fontsize=fontsize,
+        show_grid=True,
+        show_legend=True,
+        xformatter=date_axis_formatter
+    )
+
+    # Render long time series on the GPU. Short series keep the crisper canvas rendering.
+    if len(df) > webgl_threshold:
+        curve_options['hooks'] = [webgl_hook]
+
+    curve_opts = hv.opts.Curve(**curve_options)
+
+    # Send at most about max_points points to the browser
+    downsample = bool(max_points) and len(df) > max_points
+
+    for column, series in df.items():
         # Create a HoloViews Curve element for each data column
-        curve = hv.Curve(df, 'Date', column).opts(
-            width=width,
-            height=height,
-            # bgcolor='black',
-            line_color='dodgerblue',
-            fontsize=fontsize
-        )
-
-        date_axis_formatter = DatetimeTickFormatter(
-            minutes=["%H:%M"],
-            hours=["%H:%M"],
-            days=["%d %b %Y"],
-            months=["%d %b %Y"],
-            years=["%d %b %Y"]
-        )
-
-        curve.opts(
-            show_grid=True,
-            show_legend=True,
-            xformatter=date_axis_formatter
-        )
+        curve = hv.Curve((dates, series.to_numpy()), 'Date', column).opts(curve_opts)
+        if downsample:
+            curve = hv_downsample(curve, max_points)
 
         # Create a HoverTool to display tooltips. Show the values of the Date column and the selected column
         hover_tool = HoverTool(
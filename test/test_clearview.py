@@ -0,0 +1,91 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('PyQt5')
+pytest.importorskip('tkinter')
+import panel as pn
+from bokeh.models import ColumnDataSource
+
+
+@pytest.fixture(params=['ClearView_holoviews_only', 'ClearView_holoviews_and_pyqt5'])
+def clearview_module(request):
+    return pytest.importorskip(request.param)
+
+
+@pytest.fixture
+def clearview(clearview_module):
+    app = clearview_module.ClearView()
+    nrows = 100_000
+    dates = pd.date_range('2006-01-01', periods=nrows, freq='min', name='Date')
+    app.df = pd.DataFrame({
+        'Temperature': np.sin(np.arange(nrows) / 500) * 10,
+        'Flow': np.cos(np.arange(nrows) / 700) * 5 + 10,
+    }, index=dates)
+    app.create_plot()
+    app.set_time_series_methods()
+    app.create_data_dropdown_widget()
+    app.create_analysis_dropdown_widget()
+    app.create_plot_widget()
+    return app
+
+
+def plotted_points(root):
+    return max(len(source.data['Date']) for source in root.select({'type': ColumnDataSource}) if 'Date' in source.data)
+
+
+def test_plot_widget_renders_downsampled_curve(clearview):
+    root = pn.pane.HoloViews(clearview.plot.object).get_root()
+    points = plotted_points(root)
+    assert 0 < points <= 2 * clearview.app_width + 2
+
+
+def test_plot_widget_renders_after_variable_change(clearview):
+    pane = pn.pane.HoloViews(clearview.plot.object)
+    root = pane.get_root()
+    clearview.data_dropdown.value = 'Flow'
+    assert 0 < plotted_points(root) <= 2 * clearview.app_width + 2
+
+
+def test_sqlite_export_writes_the_data_and_table_name_at_submit_time(clearview_module, tmp_path):
+    app = clearview_module.ClearView()
+    app.filename = 'flow.npt'
+    app.df = pd.DataFrame({'Flow': [1.0, 2.0, 3.0]}, index=pd.date_range('2006-01-01', periods=3, freq='h', name='Date'))
+    database_path = str(tmp_path / 'export.db')
+
+    # Hold the export until another file has been opened and the table has been edited
+    with app.export_locks.setdefault(database_path, clearview_module.threading.Lock()):
+        app.export_dataframe(app.df, database_path, 'Original Data')
+        future = app.pending_exports[database_path]
+        app.df.iloc[0, 0] = -99.0
+        app.filename = 'temperature.npt'
+    future.result()
+
+    con = sqlite3.connect(database_path)
+    tables = [row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    exported = pd.read_sql('SELECT * FROM flow', con)
+    con.close()
+    assert tables == ['flow']
+    assert exported['Flow'].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_data_table_is_rebuilt_when_the_column_types_change(clearview_module):
+    app = clearview_module.ClearView()
+    dates = pd.date_range('2006-01-01', periods=3, freq='h', name='Date')
+    app.df = pd.DataFrame({'Flow': [1.0, 2.0, 3.0], 'Station': ['A', 'B', 'C']}, index=dates)
+    app.create_data_table()
+    first_table = app.data_table
+
+    # Same columns and types: the table is reused with the new data
+    app.df = pd.DataFrame({'Flow': [4.0, 5.0, 6.0], 'Station': ['D', 'E', 'F']}, index=dates)
+    app.create_data_table()
+    assert app.data_table is first_table
+    assert app.data_table.value['Flow'].tolist() == [4.0, 5.0, 6.0]
+
+    # Same columns with different types: the table is rebuilt with the new number formats
+    app.df = pd.DataFrame({'Flow': ['high', 'low', 'low'], 'Station': [1.0, 2.0, 3.0]}, index=dates)
+    app.create_data_table()
+    assert app.data_table is not first_table
+    assert set(app.bokeh_formatters) == {'Station'}
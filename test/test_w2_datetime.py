@@ -0,0 +1,33 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cequalw2 import w2_datetime
+
+
+def reference_day_of_year_to_datetime(year, days):
+    """The per-element conversion that day_of_year_to_datetime() replaced."""
+    day1 = datetime.datetime(year, 1, 1)
+    return [w2_datetime.round_time(day1 + datetime.timedelta(days=float(d) - 1), round_to=3600) for d in days]
+
+
+def test_day_of_year_to_datetime_matches_per_element_conversion():
+    days = np.concatenate([np.linspace(1, 366, 5000), [1.0, 1.0208333, 1.0208334, 32.5, 365.99]])
+    result = w2_datetime.day_of_year_to_datetime(2006, days)
+    expected = reference_day_of_year_to_datetime(2006, days)
+    # The vectorized conversion works in integer microseconds, so allow for float rounding in the last microsecond
+    differences = np.abs(np.asarray(result - pd.DatetimeIndex(expected)) / np.timedelta64(1, 'us'))
+    assert differences.max() <= 1
+
+
+def test_day_of_year_to_datetime_accepts_a_list():
+    result = w2_datetime.day_of_year_to_datetime(2020, [1, 60.5])
+    assert list(result.to_pydatetime()) == [datetime.datetime(2020, 1, 1), datetime.datetime(2020, 2, 29, 12)]
+
+
+@pytest.mark.parametrize('bad_day', [np.nan, np.inf])
+def test_day_of_year_to_datetime_rejects_non_finite_days(bad_day):
+    with pytest.raises(ValueError):
+        w2_datetime.day_of_year_to_datetime(2006, [1.0, bad_day])
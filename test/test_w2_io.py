@@ -0,0 +1,183 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from cequalw2 import w2_io
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'BerlinMilton2006')
+
+
+def read_fwf(infile, data_columns, skiprows=3):
+    """The pd.read_fwf call that read_npt_opt() replaced."""
+    return pd.read_fwf(infile, skiprows=skiprows, widths=(len(data_columns) + 1) * [8],
+                       names=['DoY', *data_columns], index_col=0, encoding=w2_io.detect_encoding(infile))
+
+
+def read_csv_with_pandas(infile, data_columns, skiprows=3):
+    """The pd.read_csv call that read_csv_pyarrow() replaced."""
+    df = pd.read_csv(infile, skiprows=skiprows, names=['DoY', *data_columns], usecols=range(len(data_columns) + 1),
+                     index_col=0)
+    df.index.name = None
+    return df
+
+
+def write_npt(tmp_path, rows, name='test.npt'):
+    infile = tmp_path / name
+    header = 'Test file\n\n     JDAY    Flow    Temp\n'
+    infile.write_text(header + ''.join(f'{row}\n' for row in rows))
+    return str(infile)
+
+
+@pytest.mark.parametrize('filename', ['2006_Met.npt', '2006_Alliance_Qtr.npt', '2006_MillCrk_Cin.npt', 'shade.npt'])
+def test_read_npt_opt_matches_read_fwf(filename):
+    infile = os.path.join(DATA_DIR, filename)
+    data_columns = w2_io.get_data_columns_fixed_width(infile)
+    df = w2_io.read_npt_opt(infile, data_columns)
+    pdt.assert_frame_equal(df, read_fwf(infile, data_columns), check_exact=True)
+
+
+def test_read_npt_opt_blank_fields_match_read_fwf(tmp_path):
+    infile = write_npt(tmp_path, ['       1     2.5      10', '       2             11', '', '       3     4.5'])
+    df = w2_io.read_npt_opt(infile, ['Flow', 'Temp'])
+    pdt.assert_frame_equal(df, read_fwf(infile, ['Flow', 'Temp']), check_exact=True)
+    assert df['Flow'].isna().tolist() == [False, True, False]
+
+
+def test_read_npt_opt_missing_day_matches_read_fwf(tmp_path):
+    infile = write_npt(tmp_path, ['       1     2.5      10', '             3.5      11'])
+    df = w2_io.read_npt_opt(infile, ['Flow', 'Temp'])
+    pdt.assert_frame_equal(df, read_fwf(infile, ['Flow', 'Temp']), check_exact=True)
+
+
+def test_parse_fixed_width_numbers_column_dtypes():
+    data = b'header\n       1     2.5      -3      +4\n       2      3.      -5    1e-3\n'
+    day, flow, temp, other = w2_io.parse_fixed_width_numbers(data, skiprows=1, ncols=4)
+    assert day.dtype == np.int64 and temp.dtype == np.int64
+    assert flow.dtype == np.float64 and other.dtype == np.float64
+    np.testing.assert_array_equal(temp, [-3, -5])
+    np.testing.assert_array_equal(other, [4.0, 0.001])
+
+
+def test_parse_fixed_width_numbers_rejects_text():
+    with pytest.raises(ValueError):
+        w2_io.parse_fixed_width_numbers(b'       1    text\n', skiprows=0, ncols=2)
+
+
+def test_read_csv_pyarrow_rejects_duplicate_names_like_pandas(tmp_path):
+    pytest.importorskip('pyarrow')
+    infile = tmp_path / 'test.csv'
+    infile.write_text('Test file\n\nJDAY,Flow,Flow\n1,2.5,10\n2,3.5,11\n')
+    with pytest.raises(ValueError):
+        w2_io.read_csv_pyarrow(str(infile), ['Flow', 'Flow'])
+    with pytest.raises(ValueError):
+        pd.read_csv(infile, skiprows=3, names=['DoY', 'Flow', 'Flow'], index_col=0)
+    with pytest.raises(IOError):
+        w2_io.read_csv(str(infile), ['Flow', 'Flow'])
+
+
+@pytest.mark.parametrize('sample, encoding', [
+    (b'Temperature (C)\n', 'utf-8'),
+    ('Temperature (\N{DEGREE SIGN}C)\n'.encode('utf-8'), 'utf-8'),
+    ('Temperature (\N{DEGREE SIGN}C)\n'.encode('latin-1'), 'latin-1'),
+])
+def test_detect_encoding(tmp_path, sample, encoding):
+    infile = tmp_path / 'test.npt'
+    infile.write_bytes(sample + b'       1     2.5\n')
+    assert w2_io.detect_encoding(str(infile)) == encoding
+
+
+def test_detect_encoding_multibyte_character_cut_off_by_the_sample(tmp_path, monkeypatch):
+    infile = tmp_path / 'test.npt'
+    infile.write_bytes('T(\N{DEGREE SIGN}C)'.encode('utf-8'))
+    monkeypatch.setattr(w2_io, 'ENCODING_SAMPLE_SIZE', 3)
+    assert w2_io.detect_encoding(str(infile)) == 'utf-8'
+
+
+@pytest.mark.parametrize('line, delimiter', [
+    (b'     1.000,    4.390,    0.000,\n', ','),
+    (b'1.000\t4.390\t0.000\n', '\t'),
+    (b'1.000;4.390;0.000\n', ';'),
+    (b'   1.000   4.390   0.000\n', None),
+])
+def test_detect_delimiter(line, delimiter):
+    assert w2_io.detect_delimiter(line) == delimiter
+
+
+def test_read_csv_pyarrow_matches_pandas():
+    pytest.importorskip('pyarrow')
+    infile = os.path.join(DATA_DIR, 'cwo_37_wdo.csv')
+    data_columns = w2_io.get_data_columns_csv(infile)
+    df = w2_io.read_csv_pyarrow(infile, data_columns)
+    pdt.assert_frame_equal(df, read_csv_with_pandas(infile, data_columns), check_exact=True)
+
+
+def test_read_csv_pyarrow_rejects_extra_columns():
+    pytest.importorskip('pyarrow')
+    infile = os.path.join(DATA_DIR, 'qwo_37_wdo.csv')
+    with pytest.raises(ValueError):
+        w2_io.read_csv_pyarrow(infile, w2_io.get_data_columns_csv(infile))
+
+
+@pytest.mark.parametrize('filename', ['cwo_37_wdo.csv', 'qwo_37_wdo.csv'])
+def test_read_csv_matches_pandas(filename):
+    infile = os.path.join(DATA_DIR, filename)
+    data_columns = w2_io.get_data_columns_csv(infile)
+    df = w2_io.read_csv(infile, data_columns)
+    pdt.assert_frame_equal(df, read_csv_with_pandas(infile, data_columns), check_exact=True)
+
+
+def test_read_csv_chunked_matches_read_csv(monkeypatch):
+    infile = os.path.join(DATA_DIR, 'cwo_37_wdo.csv')
+    monkeypatch.setattr(w2_io, 'CSV_CHUNK_THRESHOLD', 0)
+    monkeypatch.setattr(w2_io, 'CSV_CHUNK_ROWS', 1000)
+    df = w2_io.read_csv_chunked(infile, skiprows=3, header=None, index_col=0)
+    assert len(df) > 1000
+    pdt.assert_frame_equal(df, pd.read_csv(infile, skiprows=3, header=None, index_col=0), check_exact=True)
+
+
+def test_downcast_columns():
+    df = pd.DataFrame({
+        'Temperature': np.linspace(0, 30, 10),
+        'Count': np.arange(10),
+        'Station': ['BerlinMilton'] * 8 + ['Mahoning'] * 2,
+        'Name': [f'Sample {i}' for i in range(10)],
+    })
+    expected = df.copy()
+    result = w2_io.downcast_columns(df)
+    assert result['Temperature'].dtype == np.float32
+    pdt.assert_series_equal(result['Temperature'], pd.to_numeric(expected['Temperature'], downcast='float'))
+    pdt.assert_series_equal(result['Count'], expected['Count'])
+    assert isinstance(result['Station'].dtype, pd.CategoricalDtype)
+    assert result['Station'].astype(str).tolist() == expected['Station'].tolist()
+    assert result['Name'].tolist() == expected['Name'].tolist()
+    assert not isinstance(result['Name'].dtype, pd.CategoricalDtype)
+
+
+def test_write_hdf_read_hdf_round_trip(tmp_path):
+    outfile = str(tmp_path / 'test.h5')
+    dates = pd.date_range('2006-01-01', periods=100, freq='h', name='Date')
+    df = pd.DataFrame({'Temperature': np.linspace(0, 30, 100), 'Count': np.arange(100)}, index=dates)
+    w2_io.write_hdf(df, 'BerlinMilton', outfile)
+    result = w2_io.read_hdf('BerlinMilton', outfile, ['Temperature', 'Count'])
+    pdt.assert_frame_equal(result, df, check_exact=True, check_names=False, check_index_type=False, check_freq=False)
+    assert result.attrs['Filename'] == outfile
+
+
+def test_write_hdf_read_hdf_fractional_seconds(tmp_path):
+    outfile = str(tmp_path / 'test.h5')
+    dates = pd.DatetimeIndex(['2006-01-01 00:00:00.5', '2006-01-01 01:00:00'], name='Date')
+    df = pd.DataFrame({'Flow': [1.0, 2.0]}, index=dates)
+    w2_io.write_hdf(df, 'BerlinMilton', outfile)
+    result = w2_io.read_hdf('BerlinMilton', outfile, ['Flow'])
+    assert (result.index == dates).all()
+
+
+def test_read_hdf_missing_variables(tmp_path):
+    outfile = str(tmp_path / 'test.h5')
+    dates = pd.date_range('2006-01-01', periods=3, freq='h', name='Date')
+    w2_io.write_hdf(pd.DataFrame({'Flow': [1.0, 2.0, 3.0]}, index=dates), 'BerlinMilton', outfile)
+    with pytest.raises(KeyError, match='Temperature, Count'):
+        w2_io.read_hdf('BerlinMilton', outfile, ['Flow', 'Temperature', 'Count'])
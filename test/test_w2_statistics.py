@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from cequalw2 import w2_statistics
+
+
+def make_time_series(nrows=500, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2006-01-01', periods=nrows, freq='h')
+    df = pd.DataFrame({
+        'Temperature': rng.normal(15, 5, nrows),
+        'Flow': rng.gamma(2, 10, nrows),
+        'Count': rng.integers(0, 100, nrows),
+    }, index=dates)
+    df.loc[df.index[::7], 'Temperature'] = np.nan
+    return df
+
+
+def test_summary_statistics_matches_describe():
+    df = make_time_series()
+    pdt.assert_frame_equal(w2_statistics.summary_statistics(df), df.describe())
+
+
+def test_summary_statistics_all_nan_column_matches_describe():
+    df = pd.DataFrame({'a': [np.nan, np.nan, np.nan], 'b': [1.0, np.nan, 3.0], 'c': [2.0, np.nan, np.nan]})
+    pdt.assert_frame_equal(w2_statistics.summary_statistics(df), df.describe())
+
+
+def test_summary_statistics_zero_rows_matches_describe():
+    df = make_time_series().iloc[:0]
+    pdt.assert_frame_equal(w2_statistics.summary_statistics(df), df.describe())
+
+
+def test_summary_statistics_ignores_non_numeric_columns():
+    df = make_time_series(nrows=50)
+    df['Station'] = 'BerlinMilton'
+    pdt.assert_frame_equal(w2_statistics.summary_statistics(df), df.describe())
+
+
+def test_summary_statistics_no_numeric_columns():
+    df = pd.DataFrame({'Station': ['BerlinMilton', 'Mahoning']})
+    stats = w2_statistics.summary_statistics(df)
+    assert list(stats.index) == w2_statistics.SUMMARY_STATISTICS
+    assert stats.columns.empty
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from cequalw2 import w2_visualization
+
+
+def reference_lttb(x, y, n_out):
+    """A direct, point-by-point implementation of Largest-Triangle-Three-Buckets."""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = [0]
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = sum(x[end:next_end]) / (next_end - end)
+        avg_y = sum(y[end:next_end]) / (next_end - end)
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        a = best
+        indices.append(a)
+    indices.append(n - 1)
+    return np.array(indices)
+
+
+def make_time_series(nrows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2006-01-01', periods=nrows, freq='h')
+    return pd.DataFrame({
+        'Temperature': np.sin(np.arange(nrows) / 50) * 10 + rng.normal(0, 1, nrows),
+        'Flow': rng.gamma(2, 10, nrows),
+    }, index=dates)
+
+
+def test_lttb_indices_matches_reference():
+    df = make_time_series()
+    x = df.index.to_numpy().astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    y = df['Temperature'].to_numpy()
+    indices = w2_visualization.lttb_indices(df.index.to_numpy(), y, 200)
+    np.testing.assert_array_equal(indices, reference_lttb(x, y, 200))
+
+
+def test_lttb_indices_keeps_all_points_of_short_series():
+    np.testing.assert_array_equal(w2_visualization.lttb_indices(np.arange(10.0), np.arange(10.0), 20), np.arange(10))
+    np.testing.assert_array_equal(w2_visualization.lttb_indices(np.arange(10.0), np.arange(10.0), 2), np.arange(10))
+
+
+def test_lttb_indices_keeps_peaks():
+    y = np.zeros(1000)
+    y[[123, 456, 789]] = [5.0, -7.0, 9.0]
+    indices = w2_visualization.lttb_indices(np.arange(1000.0), y, 50)
+    assert {0, 123, 456, 789, 999} <= set(indices)
+
+
+def test_lttb_downsample_keeps_the_points_selected_for_each_column():
+    df = make_time_series()
+    result = w2_visualization.lttb_downsample(df, 200)
+    keep = np.zeros(len(df), dtype=bool)
+    for column in df.columns:
+        keep[w2_visualization.lttb_indices(df.index.to_numpy(), df[column].to_numpy(), 200)] = True
+    pdt.assert_frame_equal(result, df[keep])
+    assert result.index[0] == df.index[0] and result.index[-1] == df.index[-1]
+
+
+def test_lttb_downsample_returns_short_series_unchanged():
+    df = make_time_series(nrows=100)
+    assert w2_visualization.lttb_downsample(df, 200) is df
+    assert w2_visualization.lttb_downsample(df, None) is df
+
+
+def test_lttb_downsample_mixed_dtypes():
+    df = make_time_series()
+    df['Station'] = np.where(np.arange(len(df)) % 2, 'BerlinMilton', 'Mahoning')
+    result = w2_visualization.lttb_downsample(df, 200)
+    pdt.assert_frame_equal(result, df.loc[w2_visualization.lttb_downsample(df[['Temperature', 'Flow']], 200).index])
+    assert result.columns.equals(df.columns)
+
+
+def test_lttb_downsample_no_numeric_columns():
+    df = pd.DataFrame({'Station': ['BerlinMilton'] * 1000}, index=pd.date_range('2006-01-01', periods=1000, freq='h'))
+    assert w2_visualization.lttb_downsample(df, 200) is df
+
+
+def test_is_up_to_date(tmp_path):
+    infile = tmp_path / 'data.npt'
+    control = tmp_path / 'plots.yaml'
+    outfile = tmp_path / 'data.png'
+    for path in (infile, control, outfile):
+        path.write_text('')
+    os.utime(infile, (1000, 1000))
+    os.utime(control, (2000, 2000))
+
+    os.utime(outfile, (3000, 3000))
+    assert w2_visualization.is_up_to_date([str(outfile)], [str(infile), str(control)])
+
+    os.utime(outfile, (1500, 1500))
+    assert not w2_visualization.is_up_to_date([str(outfile)], [str(infile), str(control)])
+
+
+def test_is_up_to_date_missing_output(tmp_path):
+    infile = tmp_path / 'data.npt'
+    infile.write_text('')
+    assert not w2_visualization.is_up_to_date([str(tmp_path / 'data.png')], [str(infile)])
+    assert not w2_visualization.is_up_to_date([], [str(infile)])